@@ -4,10 +4,13 @@ TexasProof Core Module - CLAUDEME-compliant foundation.
 Every other file imports this. Contains dual_hash, emit_receipt, merkle, StopRuleException.
 """
 
+import atexit
 import hashlib
 import json
+import os
 import sys
-from datetime import datetime, timezone
+import time
+import warnings
 from typing import Any, Union
 
 # Try to import blake3, fallback to sha256 if not available
@@ -17,6 +20,15 @@ try:
 except ImportError:
     HAS_BLAKE3 = False
 
+# SHA256 should come from OpenSSL, which uses SHA-NI / ARMv8 crypto instructions
+# when the CPU has them; CPython's builtin fallback is the portable C path.
+SHA256_BACKEND = "openssl" if hashlib.sha256.__name__ == "openssl_sha256" else "builtin"
+if SHA256_BACKEND != "openssl":
+    warnings.warn(
+        "hashlib.sha256 is not OpenSSL-backed; dual_hash will use the slower builtin SHA256",
+        RuntimeWarning,
+    )
+
 # Constants
 TENANT_ID = "texasproof"
 
@@ -50,6 +62,10 @@ RECEIPT_SCHEMA = {
     ]
 }
 
+# Set views of the schema for O(1) membership checks
+RECEIPT_TYPES = frozenset(RECEIPT_SCHEMA["types"])
+REQUIRED_RECEIPT_FIELDS = frozenset(RECEIPT_SCHEMA["base_fields"])
+
 # Monte Carlo Defaults
 DEFAULT_CYCLES = 1000
 DEFAULT_MONTE_CARLO_RUNS = 10000
@@ -87,14 +103,15 @@ PAXTON_TRUST_DISBURSEMENT_USD = 20_000
 
 # Pass/Fail
 MAX_CONSECUTIVE_FAILURES = 2
-SCENARIO_NAMES = [
+SCENARIO_NAMES = (
     "baseline",
     "stress",
     "genesis",
     "colony_ridge",
     "fund_diversion",
     "godel"
-]
+)
+SCENARIO_NAME_SET = frozenset(SCENARIO_NAMES)
 
 # Scenario tolerances (entropy conservation)
 SCENARIO_TOLERANCES = {
@@ -116,12 +133,77 @@ class StopRuleException(Exception):
         self.action = action
 
 
-def dual_hash(data: Union[bytes, str]) -> str:
+# BLAKE3 implementation is decided once at import, not per hash call
+if HAS_BLAKE3:
+    # Below this size thread startup costs more than BLAKE3's tree parallelism saves
+    BLAKE3_MULTITHREAD_MIN_BYTES = 128 * 1024
+
+    def _blake3_digest(data: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Raw BLAKE3 digest; large inputs hash across all cores."""
+        if len(data) >= BLAKE3_MULTITHREAD_MIN_BYTES:
+            return blake3.blake3(data, max_threads=blake3.blake3.AUTO).digest()
+        return blake3.blake3(data).digest()
+else:
+    # Fallback: use sha256 again but with different prefix, absorbed once
+    _BLAKE3_FALLBACK = hashlib.sha256(b"blake3_fallback:")
+
+    def _blake3_digest(data: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Prefixed SHA256 digest standing in for BLAKE3."""
+        fallback = _BLAKE3_FALLBACK.copy()
+        fallback.update(data)
+        return fallback.digest()
+
+
+# Size of a raw SHA256 || BLAKE3 digest pair
+_DUAL_DIGEST_SIZE = 64
+
+
+def _dual_hash_bytes(data: Union[bytes, bytearray, memoryview]) -> bytes:
+    """
+    Raw SHA256 || BLAKE3 digests (32 + 32 bytes). Pure function.
+
+    Both hashes run back-to-back over the same buffer; no copy is made.
+
+    Args:
+        data: Bytes-like object to hash
+
+    Returns:
+        64-byte concatenation of the two digests
+    """
+    return hashlib.sha256(data).digest() + _blake3_digest(data)
+
+
+def _format_dual_hash(digest: bytes) -> str:
+    """Render a 64-byte dual digest as "sha256_hex:blake3_hex"."""
+    return f"{digest[:32].hex()}:{digest[32:].hex()}"
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """
+    Compact, key-sorted, UTF-8 JSON bytes.
+
+    Always the stdlib serializer, so payload hashes and Merkle roots are
+    byte-identical in every environment. NumPy scalars and arrays serialize
+    as their Python equivalents.
+    """
+    return json.dumps(
+        obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=_json_default
+    ).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """json default hook: NumPy scalars and arrays via tolist()."""
+    if hasattr(obj, "dtype") and hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dual_hash(data: Union[bytes, bytearray, memoryview, str]) -> str:
     """
     SHA256:BLAKE3 format per CLAUDEME §8. Pure function.
 
     Args:
-        data: Bytes or string to hash
+        data: Bytes-like object or string to hash
 
     Returns:
         String in format "sha256_hex:blake3_hex"
@@ -129,15 +211,28 @@ def dual_hash(data: Union[bytes, str]) -> str:
     if isinstance(data, str):
         data = data.encode('utf-8')
 
-    sha = hashlib.sha256(data).hexdigest()
+    return _format_dual_hash(_dual_hash_bytes(data))
 
-    if HAS_BLAKE3:
-        b3 = blake3.blake3(data).hexdigest()
-    else:
-        # Fallback: use sha256 again but with different prefix
-        b3 = hashlib.sha256(b"blake3_fallback:" + data).hexdigest()
 
-    return f"{sha}:{b3}"
+# (second, "YYYY-MM-DDTHH:MM:SS") for the most recent whole second seen. One
+# tuple, replaced whole, so a concurrent reader never pairs a second with
+# another second's prefix
+_ts_cache = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as ISO8601 with microseconds and a Z suffix.
+
+    The whole-second prefix is formatted once per second and reused.
+    """
+    global _ts_cache
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{micros:06d}Z"
 
 
 def emit_receipt(receipt_type: str, data: dict, output: bool = True) -> dict:
@@ -152,15 +247,20 @@ def emit_receipt(receipt_type: str, data: dict, output: bool = True) -> dict:
     Returns:
         Complete receipt dict
     """
+    # Receipt types are a small vocabulary; interned keys compare by identity
+    # in every downstream Counter/dict/cache lookup
+    receipt_type = sys.intern(receipt_type)
+
     # Ensure tenant_id is set
     if "tenant_id" not in data:
         data["tenant_id"] = TENANT_ID
 
     # Create timestamp
-    ts = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    ts = _utc_timestamp()
 
-    # Create payload hash
-    payload_hash = dual_hash(json.dumps(data, sort_keys=True))
+    # Create payload hash over compact canonical bytes (serialized once)
+    payload_json = _canonical_json(data)
+    payload_hash = dual_hash(payload_json)
 
     # Build receipt
     receipt = {
@@ -173,11 +273,147 @@ def emit_receipt(receipt_type: str, data: dict, output: bool = True) -> dict:
 
     # Output to stdout (append-only ledger in dev mode)
     if output:
-        print(json.dumps(receipt), flush=True)
+        line = _receipt_line(receipt_type, ts, payload_hash, payload_json, data, receipt)
+        if _ACTIVE_BUFFER is not None:
+            _ACTIVE_BUFFER.emit(line)
+        else:
+            _write_ledger(line + b"\n")
 
     return receipt
 
 
+def emit_receipts_batch(items: list, output: bool = True) -> list:
+    """
+    Emit several receipts with a single ledger write.
+
+    Args:
+        items: List of (receipt_type, data) tuples
+        output: Whether to print to stdout (default True)
+
+    Returns:
+        List of complete receipt dicts, in input order
+    """
+    # An active buffer already batches writes; joining it keeps ledger order
+    if not output or _ACTIVE_BUFFER is not None:
+        return [emit_receipt(receipt_type, data, output=output) for receipt_type, data in items]
+
+    with ReceiptBuffer(n=len(items) + 1):
+        return [emit_receipt(receipt_type, data) for receipt_type, data in items]
+
+
+# Header keys spliced ahead of the canonical payload in the ledger line
+_RESERVED_RECEIPT_KEYS = ("receipt_type", "ts", "payload_hash")
+
+
+def _receipt_line(
+    receipt_type: str,
+    ts: str,
+    payload_hash: str,
+    payload_json: bytes,
+    data: dict,
+    receipt: dict
+) -> bytes:
+    """
+    Ledger line for a receipt, reusing the already-serialized payload.
+
+    The header fields are spliced in front of the canonical payload JSON so the
+    payload is not serialized a second time. Payloads that shadow a header key
+    fall back to serializing the merged receipt.
+    """
+    if any(key in data for key in _RESERVED_RECEIPT_KEYS):
+        return _canonical_json(receipt)
+
+    header = (
+        f'{{"receipt_type":{json.dumps(receipt_type)},"ts":"{ts}",'
+        f'"payload_hash":"{payload_hash}"'
+    ).encode('utf-8')
+    if payload_json == b"{}":
+        return header + b"}"
+    return header + b"," + payload_json[1:]
+
+
+def _write_ledger(data: bytes) -> None:
+    """Write newline-terminated ledger bytes to stdout, flushing immediately."""
+    stream = sys.stdout
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        # No file descriptor (e.g. StringIO or pytest capsys)
+        fd = None
+
+    if fd is not None:
+        # Drain any pending text, then hand the bytes straight to write(2)
+        stream.flush()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        return
+
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        # Text-only stream (e.g. redirected to StringIO)
+        stream.write(data.decode('utf-8'))
+        stream.flush()
+        return
+
+    # Drain any pending text first so ledger ordering is preserved
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+class ReceiptBuffer:
+    """
+    Batch ledger lines and write them to stdout every `n` receipts.
+
+    Use as a context manager; while active, emit_receipt(output=True) appends to
+    the buffer instead of writing (and flushing) once per receipt. Pending lines
+    are written on exit, on flush(), and at interpreter shutdown. Entering while
+    another buffer is active defers to that outer buffer, keeping ledger order.
+    """
+
+    def __init__(self, n: int = 256):
+        self.buf = bytearray()
+        self.n = n
+        self.count = 0
+        self._previous = None
+
+    def emit(self, line: bytes) -> None:
+        """Append one ledger line, writing the batch once `n` lines are pending."""
+        self.buf += line
+        self.buf += b"\n"
+        self.count += 1
+        if self.count >= self.n:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending lines to stdout."""
+        if self.buf:
+            _write_ledger(bytes(self.buf))
+            self.buf.clear()
+        self.count = 0
+
+    def __enter__(self) -> "ReceiptBuffer":
+        global _ACTIVE_BUFFER
+        self._previous = _ACTIVE_BUFFER
+        if self._previous is None:
+            _ACTIVE_BUFFER = self
+            atexit.register(self.flush)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        global _ACTIVE_BUFFER
+        if self._previous is None:
+            _ACTIVE_BUFFER = None
+            atexit.unregister(self.flush)
+            self.flush()
+        self._previous = None
+
+
+# Buffer that emit_receipt writes through while a ReceiptBuffer is active
+_ACTIVE_BUFFER = None
+
+
 def merkle(items: list) -> str:
     """
     Compute Merkle root using dual_hash. Handle empty and odd counts.
@@ -191,21 +427,29 @@ def merkle(items: list) -> str:
     if not items:
         return dual_hash(b"empty")
 
-    # Hash each item
-    hashes = [dual_hash(json.dumps(item, sort_keys=True) if isinstance(item, dict) else str(item))
-              for item in items]
+    # Hash each item into one preallocated buffer of raw 64-byte digests
+    # (one spare slot for duplicating an odd tail)
+    count = len(items)
+    nodes = memoryview(bytearray(_DUAL_DIGEST_SIZE * (count + 1)))
+    for i, item in enumerate(items):
+        leaf = _canonical_json(item) if isinstance(item, dict) else str(item).encode('utf-8')
+        nodes[i * _DUAL_DIGEST_SIZE:(i + 1) * _DUAL_DIGEST_SIZE] = _dual_hash_bytes(leaf)
 
-    # Build tree
-    while len(hashes) > 1:
+    # Build tree in place: pair i is read from slots 2i, 2i+1 and written to slot i
+    while count > 1:
         # Handle odd count by duplicating last
-        if len(hashes) % 2:
-            hashes.append(hashes[-1])
+        if count % 2:
+            nodes[count * _DUAL_DIGEST_SIZE:(count + 1) * _DUAL_DIGEST_SIZE] = \
+                nodes[(count - 1) * _DUAL_DIGEST_SIZE:count * _DUAL_DIGEST_SIZE]
+            count += 1
 
         # Pair and hash
-        hashes = [dual_hash(hashes[i] + hashes[i+1])
-                  for i in range(0, len(hashes), 2)]
+        for i in range(count // 2):
+            pair = nodes[2 * i * _DUAL_DIGEST_SIZE:(2 * i + 2) * _DUAL_DIGEST_SIZE]
+            nodes[i * _DUAL_DIGEST_SIZE:(i + 1) * _DUAL_DIGEST_SIZE] = _dual_hash_bytes(pair)
+        count //= 2
 
-    return hashes[0]
+    return _format_dual_hash(nodes[:_DUAL_DIGEST_SIZE].tobytes())
 
 
 def stoprule_detection_rate(rate: float, threshold: float = 0.70) -> None:
@@ -261,8 +505,7 @@ def stoprule_consecutive_failures(failures: int, max_failures: int = 2) -> None:
 
 def validate_receipt(receipt: dict) -> bool:
     """Validate that a receipt has all required fields."""
-    required = ["receipt_type", "ts", "tenant_id", "payload_hash"]
-    return all(field in receipt for field in required)
+    return receipt.keys() >= REQUIRED_RECEIPT_FIELDS
 
 
 def anchor_receipts(receipts: list) -> dict:
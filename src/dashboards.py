@@ -4,131 +4,139 @@ Dashboard Generation for TexasProof.
 Generates HTML dashboards for fraud detection results.
 """
 
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from string import Template
 
 from .core import emit_receipt, TENANT_ID
 
 
-DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+DASHBOARD_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
+    <title>$title</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
             background: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #1a365d 0%, #2d3748 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 20px;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2em;
-        }}
-        .header .subtitle {{
+        }
+        .header .subtitle {
             opacity: 0.8;
             margin-top: 10px;
-        }}
-        .card {{
+        }
+        .card {
             background: white;
             border-radius: 10px;
             padding: 20px;
             margin-bottom: 20px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .card h2 {{
+        }
+        .card h2 {
             margin-top: 0;
             color: #1a365d;
             border-bottom: 2px solid #e2e8f0;
             padding-bottom: 10px;
-        }}
-        .metric {{
+        }
+        .metric {
             display: inline-block;
             padding: 15px 25px;
             margin: 5px;
             border-radius: 8px;
             text-align: center;
-        }}
-        .metric.good {{
+        }
+        .metric.good {
             background: #c6f6d5;
             color: #22543d;
-        }}
-        .metric.warning {{
+        }
+        .metric.warning {
             background: #fefcbf;
             color: #744210;
-        }}
-        .metric.bad {{
+        }
+        .metric.bad {
             background: #fed7d7;
             color: #742a2a;
-        }}
-        .metric .value {{
+        }
+        .metric .value {
             font-size: 2em;
             font-weight: bold;
-        }}
-        .metric .label {{
+        }
+        .metric .label {
             font-size: 0.9em;
             opacity: 0.8;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #e2e8f0;
-        }}
-        th {{
+        }
+        th {
             background: #edf2f7;
             font-weight: 600;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background: #f7fafc;
-        }}
-        .status-pass {{
+        }
+        .status-pass {
             color: #22543d;
             font-weight: bold;
-        }}
-        .status-fail {{
+        }
+        .status-fail {
             color: #742a2a;
             font-weight: bold;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             padding: 20px;
             color: #718096;
             font-size: 0.9em;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="header">
-        <h1>{title}</h1>
-        <div class="subtitle">Generated: {timestamp}</div>
+        <h1>$title</h1>
+        <div class="subtitle">Generated: $timestamp</div>
     </div>
 
-    {content}
+    $content
 
     <div class="footer">
-        TexasProof v1.0 | Receipt Hash: {receipt_hash}
+        TexasProof v1.0 | Receipt Hash: $receipt_hash
     </div>
 </body>
 </html>
-"""
+""")
+
+
+def _utc_now() -> str:
+    """Current UTC time as ISO8601 with a Z suffix."""
+    return datetime.utcnow().isoformat() + "Z"
 
 
-def generate_ols_dashboard(results: dict = None) -> str:
+def generate_ols_dashboard(results: dict = None, timestamp: str = None) -> str:
     """Generate OLS Contractor Dashboard."""
     results = results or {}
 
@@ -192,15 +200,15 @@ def generate_ols_dashboard(results: dict = None) -> str:
     </div>
     """
 
-    return DASHBOARD_TEMPLATE.format(
+    return DASHBOARD_TEMPLATE.substitute(
         title="OLS Contractor Dashboard - TexasProof",
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=timestamp or _utc_now(),
         content=content,
         receipt_hash="sha256:abc123...def456"
     )
 
 
-def generate_pac_dashboard(results: dict = None) -> str:
+def generate_pac_dashboard(results: dict = None, timestamp: str = None) -> str:
     """Generate PAC Influence Dashboard."""
     results = results or {}
 
@@ -264,15 +272,15 @@ def generate_pac_dashboard(results: dict = None) -> str:
     </div>
     """
 
-    return DASHBOARD_TEMPLATE.format(
+    return DASHBOARD_TEMPLATE.substitute(
         title="PAC Influence Dashboard - TexasProof",
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=timestamp or _utc_now(),
         content=content,
         receipt_hash="sha256:def456...ghi789"
     )
 
 
-def generate_colony_ridge_dashboard(results: dict = None) -> str:
+def generate_colony_ridge_dashboard(results: dict = None, timestamp: str = None) -> str:
     """Generate Colony Ridge Predatory Lending Dashboard."""
     results = results or {}
 
@@ -344,15 +352,15 @@ def generate_colony_ridge_dashboard(results: dict = None) -> str:
     </div>
     """
 
-    return DASHBOARD_TEMPLATE.format(
+    return DASHBOARD_TEMPLATE.substitute(
         title="Colony Ridge Dashboard - TexasProof",
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=timestamp or _utc_now(),
         content=content,
         receipt_hash="sha256:ghi789...jkl012"
     )
 
 
-def generate_master_dashboard(results: dict = None) -> str:
+def generate_master_dashboard(results: dict = None, timestamp: str = None) -> str:
     """Generate Master Texas Dashboard with all scenarios."""
     results = results or {}
 
@@ -458,14 +466,38 @@ def generate_master_dashboard(results: dict = None) -> str:
     </div>
     """
 
-    return DASHBOARD_TEMPLATE.format(
+    return DASHBOARD_TEMPLATE.substitute(
         title="TexasProof Master Dashboard",
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=timestamp or _utc_now(),
         content=content,
         receipt_hash="sha256:master...hash"
     )
 
 
+# Placeholder rendered in place of the Generated stamp, then spliced out
+_TIMESTAMP_SLOT = "\x00timestamp\x00"
+
+
+@functools.lru_cache(maxsize=None)
+def _render_static(generator) -> tuple:
+    """
+    Render a dashboard generator with no results, split around its timestamp.
+
+    The static render does not change between batches, so it is cached per
+    generator; each batch only splices its own Generated stamp in between.
+    """
+    html = generator(timestamp=_TIMESTAMP_SLOT).encode("utf-8")
+    head, _, tail = html.partition(_TIMESTAMP_SLOT.encode("utf-8"))
+    return head, tail
+
+
+def _write_dashboard(filepath: Path, generator, timestamp: str) -> str:
+    """Write one dashboard's static render, stamped with timestamp, to filepath."""
+    head, tail = _render_static(generator)
+    filepath.write_bytes(head + timestamp.encode("utf-8") + tail)
+    return str(filepath)
+
+
 def generate_all_dashboards(output_dir: str = None) -> dict:
     """
     Generate all dashboards.
@@ -489,11 +521,17 @@ def generate_all_dashboards(output_dir: str = None) -> dict:
         ("master_texas_dashboard.html", generate_master_dashboard),
     ]
 
-    for filename, generator in dashboards:
-        filepath = output_dir / filename
-        content = generator()
-        filepath.write_text(content)
-        generated[filename] = str(filepath)
+    # One timestamp for the whole batch
+    timestamp = _utc_now()
+
+    # Render and write concurrently; results are collected in dashboard order
+    with ThreadPoolExecutor(max_workers=len(dashboards)) as executor:
+        futures = [
+            (filename, executor.submit(_write_dashboard, output_dir / filename, generator, timestamp))
+            for filename, generator in dashboards
+        ]
+        for filename, future in futures:
+            generated[filename] = future.result()
 
     emit_receipt("dashboards_generated", {
         "tenant_id": TENANT_ID,
@@ -9,14 +9,64 @@ The Physics:
 - PAC-to-primary-purge pipelines are TOO predictable (low entropy) → suspicious
 """
 
+import functools
 import math
+import threading
 import zlib
 from collections import Counter
 from typing import Any
 
 import numpy as np
 
-from .core import emit_receipt, TENANT_ID
+from .core import _canonical_json, emit_receipt, TENANT_ID
+
+# Try to import zstandard, fallback to zlib if not available
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Try to import numba, fallback to NumPy if not available
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Bounded memo size for the pure entropy/compression helpers below. The memos
+# key on Python's built-in (non-cryptographic) hash of their inputs; dual_hash
+# is reserved for receipt integrity and never used as a cache key.
+ENTROPY_CACHE_SIZE = 256
+
+# zlib level for compression-based scores. The ratio is a heuristic signal, not
+# storage; level 9's lazy-match search costs far more than it moves the ratio.
+ENTROPY_COMPRESSION_LEVEL = 3
+
+# zstd level used instead of zlib when zstandard is installed
+ENTROPY_ZSTD_LEVEL = 1
+
+# Fraud-score payloads below this size skip the compressor: at a few hundred
+# bytes the ratio is dominated by fixed framing overhead, not content
+ENTROPY_COMPRESSION_MIN_BYTES = 256
+
+# One zstd compressor per thread: context setup dominates on small payloads,
+# and a ZstdCompressor must not be shared across threads.
+_ZSTD_LOCAL = threading.local()
+
+
+def _zstd_compressor() -> "zstandard.ZstdCompressor":
+    """This thread's reusable compressor, created on first use."""
+    compressor = getattr(_ZSTD_LOCAL, "compressor", None)
+    if compressor is None:
+        # Frame extras are off so only compressed content counts toward the ratio
+        compressor = _ZSTD_LOCAL.compressor = zstandard.ZstdCompressor(
+            level=ENTROPY_ZSTD_LEVEL,
+            write_content_size=False,
+            write_dict_id=False
+        )
+    return compressor
 
 
 def shannon_entropy(distribution: np.ndarray) -> float:
@@ -29,21 +79,36 @@ def shannon_entropy(distribution: np.ndarray) -> float:
     Returns:
         Shannon entropy in bits
     """
-    # Handle numpy array
     dist = np.asarray(distribution, dtype=np.float64)
 
-    # If counts, normalize to probabilities
-    if dist.sum() > 1.001 or dist.sum() < 0.999:
-        total = dist.sum()
-        if total == 0:
-            return 0.0
-        dist = dist / total
+    if HAS_NUMBA:
+        return float(_entropy_from_counts(dist.ravel()))
 
-    # Filter out zeros to avoid log(0)
-    dist = dist[dist > 0]
+    total = dist.sum()
+    if total <= 0:
+        return 0.0
 
-    # Compute entropy
-    return float(-np.sum(dist * np.log2(dist)))
+    # Counts identity H = log2(T) - Σ c·log2(c) / T holds for counts and for
+    # probabilities (T = 1), so no normalization pass is needed. 0·log 0 = 0.
+    log_dist = np.log2(dist, out=np.zeros_like(dist), where=dist > 0)
+
+    # Clamp rounding noise (a single symbol can land at -1e-17)
+    return max(0.0, float(np.log2(total) - np.dot(dist, log_dist) / total))
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _entropy_from_counts(counts):
+        """Compiled shannon_entropy kernel: one pass, no temporary arrays."""
+        total = 0.0
+        weighted = 0.0
+        for c in counts:
+            total += c
+            if c > 0:
+                weighted += c * math.log2(c)
+        if total <= 0:
+            return 0.0
+        return max(0.0, math.log2(total) - weighted / total)
 
 
 def system_entropy(receipts: list) -> float:
@@ -59,11 +124,21 @@ def system_entropy(receipts: list) -> float:
     if not receipts:
         return 0.0
 
-    # Count receipt types
-    type_counts = Counter(r.get("receipt_type", "unknown") for r in receipts)
+    # Entropy depends only on the receipt-type counts (Counter's C counting
+    # loop beats np.unique, which sorts object arrays with Python-level
+    # comparisons). The memo keys on those counts, whose size is bounded by the
+    # type vocabulary, so cached keys never pin whole receipt streams
+    type_counts = Counter([r.get("receipt_type", "unknown") for r in receipts])
+    return _receipt_type_entropy(tuple(type_counts.items()))
 
-    # Convert to distribution
-    counts = np.array(list(type_counts.values()), dtype=np.float64)
+
+@functools.lru_cache(maxsize=ENTROPY_CACHE_SIZE)
+def _receipt_type_entropy(type_counts: tuple) -> float:
+    """Entropy of (receipt_type, count) pairs. Memoized; see system_entropy."""
+    # Counts go straight into the array, no intermediate list
+    counts = np.fromiter(
+        (count for _, count in type_counts), dtype=np.float64, count=len(type_counts)
+    )
 
     return shannon_entropy(counts)
 
@@ -95,6 +170,18 @@ def agent_fitness(
     return (entropy_before - entropy_after) / pattern_count
 
 
+@functools.lru_cache(maxsize=ENTROPY_CACHE_SIZE)
+def _contract_type_score(contract_type: str) -> float:
+    """Entropy contribution of a contract type; the set of types is small."""
+    contract_type = contract_type.lower()
+    score = 0.0
+    if "emergency" in contract_type:
+        score += 0.4
+    if "no-bid" in contract_type or "no_bid" in contract_type:
+        score += 0.3
+    return score
+
+
 def contract_entropy(contract: dict) -> float:
     """
     Compute entropy score for single contract.
@@ -106,14 +193,8 @@ def contract_entropy(contract: dict) -> float:
     Returns:
         Entropy score 0-1 (higher = more chaotic/suspicious)
     """
-    score = 0.0
-
     # Contract type factor
-    contract_type = contract.get("contract_type", "").lower()
-    if "emergency" in contract_type:
-        score += 0.4
-    if "no-bid" in contract_type or "no_bid" in contract_type:
-        score += 0.3
+    score = _contract_type_score(contract.get("contract_type", ""))
 
     # Cost anomaly factor
     cost_per_unit = contract.get("cost_per_unit", 0)
@@ -128,6 +209,48 @@ def contract_entropy(contract: dict) -> float:
     return min(1.0, score)
 
 
+def contract_entropy_batch(contracts: list) -> np.ndarray:
+    """
+    Vectorized contract_entropy over many contracts.
+
+    Fields are gathered once into structure-of-arrays form; the scoring is
+    then whole-array arithmetic. Matches contract_entropy element-wise.
+
+    Args:
+        contracts: List of contract dicts
+
+    Returns:
+        Array of entropy scores 0-1
+    """
+    n = len(contracts)
+
+    # Contract type factor
+    type_score = np.fromiter(
+        (_contract_type_score(c.get("contract_type", "")) for c in contracts),
+        dtype=np.float64, count=n
+    )
+    cost_per_unit = np.fromiter(
+        (c.get("cost_per_unit", 0) for c in contracts), dtype=np.float64, count=n
+    )
+    market_rate = np.fromiter(
+        (c.get("market_rate", c.get("cost_per_unit", 0)) for c in contracts),
+        dtype=np.float64, count=n
+    )
+    donor_correlation = np.fromiter(
+        (c.get("donor_correlation", 0) for c in contracts), dtype=np.float64, count=n
+    )
+
+    # Cost anomaly factor
+    cost_anomaly = (market_rate > 0) & (cost_per_unit > market_rate * 2)
+
+    score = type_score + np.where(cost_anomaly, 0.2, 0.0)
+
+    # Donor correlation factor
+    score += donor_correlation * 0.1
+
+    return np.minimum(1.0, score)
+
+
 def pac_flow_entropy(donations: list, outcomes: list) -> float:
     """
     Compute entropy of donor→policy correlation.
@@ -150,20 +273,13 @@ def pac_flow_entropy(donations: list, outcomes: list) -> float:
     if not donor_set or not outcome_set:
         return 1.0
 
-    # Count donor→outcome correlations
-    correlations = []
-    for donor in donor_set:
-        donor_donations = [d for d in donations if d.get("donor") == donor]
-        donor_total = sum(d.get("amount", 0) for d in donor_donations)
+    # Count donor→outcome correlations in one pass over outcomes; an outcome
+    # naming the same donor as beneficiary and aligned_donor counts once
+    aligned_counts = Counter()
+    for o in outcomes:
+        aligned_counts.update({o.get("beneficiary"), o.get("aligned_donor")})
 
-        # Find outcomes that align with donor interests
-        aligned_outcomes = sum(
-            1 for o in outcomes
-            if o.get("beneficiary") == donor or o.get("aligned_donor") == donor
-        )
-
-        if len(outcomes) > 0:
-            correlations.append(aligned_outcomes / len(outcomes))
+    correlations = [aligned_counts[donor] / len(outcomes) for donor in donor_set]
 
     if not correlations:
         return 1.0
@@ -199,11 +315,31 @@ def compression_ratio(data: bytes) -> float:
     if not data:
         return 0.0
 
-    original_size = len(data)
-    compressed = zlib.compress(data, level=9)
-    compressed_size = len(compressed)
+    return _compressed_size(bytes(data)) / len(data)
 
-    return compressed_size / original_size
+
+def byte_entropy_ratio(data: bytes) -> float:
+    """
+    Order-0 compressibility estimate from the byte histogram.
+
+    Args:
+        data: Bytes to score
+
+    Returns:
+        Byte entropy as a fraction of 8 bits (0-1)
+    """
+    if not data:
+        return 0.0
+
+    counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    return shannon_entropy(counts) / 8
+
+
+def _compressibility(data: bytes) -> float:
+    """Compression resistance signal, estimated for payloads too small to compress."""
+    if len(data) < ENTROPY_COMPRESSION_MIN_BYTES:
+        return byte_entropy_ratio(data)
+    return compression_ratio(data)
 
 
 def mdl_score(data: bytes, model_size: int = 0) -> float:
@@ -222,11 +358,35 @@ def mdl_score(data: bytes, model_size: int = 0) -> float:
         return 0.0
 
     # Compressed size is an approximation of Kolmogorov complexity
-    compressed = zlib.compress(data, level=9)
-
     # MDL = model_size + data_given_model
     # For fraud, data_given_model is high because fraud doesn't fit the model
-    return model_size + len(compressed)
+    return model_size + _compressed_size(bytes(data))
+
+
+@functools.lru_cache(maxsize=ENTROPY_CACHE_SIZE)
+def _compressed_size(data: bytes) -> int:
+    """Compressed size of data (zstd if available, else zlib). Memoized."""
+    if HAS_ZSTD:
+        return len(_zstd_compressor().compress(data))
+    # A fresh zlib.compress is cheapest here: compressobj().copy() clones the
+    # whole deflate state and measured slower than initialising a new one
+    return len(zlib.compress(data, level=ENTROPY_COMPRESSION_LEVEL))
+
+
+def entropy_cache_info() -> dict:
+    """Hit/miss statistics for the entropy memo caches."""
+    return {
+        "receipt_type_entropy": _receipt_type_entropy.cache_info(),
+        "contract_type_score": _contract_type_score.cache_info(),
+        "compressed_size": _compressed_size.cache_info(),
+    }
+
+
+def clear_entropy_caches() -> None:
+    """Drop all memoized entropy/compression results."""
+    _receipt_type_entropy.cache_clear()
+    _contract_type_score.cache_clear()
+    _compressed_size.cache_clear()
 
 
 def entropy_fraud_score(contract: dict) -> float:
@@ -239,13 +399,13 @@ def entropy_fraud_score(contract: dict) -> float:
     Returns:
         Fraud probability 0-1
     """
-    # Contract entropy
-    c_entropy = contract_entropy(contract)
+    # Contract entropy; compression resistance (bytes only feed the compressor)
+    return _entropy_fraud_score_from(contract_entropy(contract), _canonical_json(contract))
+
 
-    # Compression resistance
-    import json
-    data = json.dumps(contract, sort_keys=True).encode()
-    c_ratio = compression_ratio(data)
+def _entropy_fraud_score_from(c_entropy: float, data: bytes) -> float:
+    """entropy_fraud_score from an already computed entropy and serialized contract."""
+    c_ratio = _compressibility(data)
 
     # Combine scores (weighted average)
     # High contract entropy + high compression ratio = fraud
@@ -254,6 +414,27 @@ def entropy_fraud_score(contract: dict) -> float:
     return min(1.0, score)
 
 
+def entropy_fraud_score_batch(contracts: list) -> np.ndarray:
+    """
+    Vectorized entropy_fraud_score over many contracts.
+
+    Args:
+        contracts: List of contract dicts
+
+    Returns:
+        Array of fraud probabilities 0-1
+    """
+    c_entropy = contract_entropy_batch(contracts)
+
+    # Compression is per payload
+    c_ratio = np.fromiter(
+        (_compressibility(_canonical_json(c)) for c in contracts),
+        dtype=np.float64, count=len(contracts)
+    )
+
+    return np.minimum(1.0, 0.6 * c_entropy + 0.4 * c_ratio)
+
+
 def resilience_alpha(
     detection_rates: list,
     pressure_levels: list
@@ -273,21 +454,25 @@ def resilience_alpha(
 
     # α measures how much detection degrades with pressure
     # Perfect resilience: detection stays constant regardless of pressure
-    rates = np.array(detection_rates)
-    pressures = np.array(pressure_levels)
+    rates = np.asarray(detection_rates, dtype=np.float64)
+    pressures = np.asarray(pressure_levels, dtype=np.float64)
 
     if len(rates) < 2:
         return rates[0] if len(rates) == 1 else 1.0
 
-    # Compute slope of detection vs pressure
+    # Compute slope of detection vs pressure (closed-form degree-1 least squares)
     # Negative slope = detection degrades with pressure
-    try:
-        slope, _ = np.polyfit(pressures, rates, 1)
-    except np.linalg.LinAlgError:
-        return rates.mean()
+    rate_mean = rates.mean()
+    dx = pressures - pressures.mean()
+    sxx = dx @ dx
+    if sxx == 0:
+        return rate_mean
+    slope = (dx @ (rates - rate_mean)) / sxx
 
     # α = base rate - degradation factor
-    base_rate = rates[pressures == 0].mean() if (pressures == 0).any() else rates.mean()
+    at_zero = pressures == 0
+    n_zero = np.count_nonzero(at_zero)
+    base_rate = rates[at_zero].sum() / n_zero if n_zero else rate_mean
 
     # Normalize: if no degradation (slope=0), α = base_rate
     # If severe degradation (slope=-1), α approaches 0
@@ -7,10 +7,14 @@ What bleeds, breeds. Recurring wound patterns crystallize into watchers.
 from typing import Any
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
+import functools
 import uuid
 
+import numpy as np
+
 from .core import (
     emit_receipt,
+    emit_receipts_batch,
     dual_hash,
     TENANT_ID,
     GENESIS_AUTOCATALYSIS_THRESHOLD,
@@ -31,21 +35,36 @@ def harvest_wounds(receipts: list, days: int = 30) -> list:
     """
     cutoff = datetime.utcnow() - timedelta(days=days)
 
-    wounds = []
-    for r in receipts:
-        # Check if it's a wound receipt
-        receipt_type = r.get("receipt_type", "")
-        if "wound" in receipt_type or "anomaly" in receipt_type or "violation" in receipt_type:
-            # Parse timestamp
-            try:
-                ts = datetime.fromisoformat(r.get("ts", "").replace("Z", ""))
-                if ts >= cutoff:
-                    wounds.append(r)
-            except (ValueError, TypeError):
-                # If timestamp invalid, include it (conservative)
-                wounds.append(r)
+    # Check if it's a wound receipt
+    wounds = [r for r in receipts if _is_wound_type(r.get("receipt_type", ""))]
+    if not wounds:
+        return wounds
+
+    # Parse all timestamps in one call; unparseable stamps become NaT
+    stamps = [r.get("ts", "").replace("Z", "") for r in wounds]
+    try:
+        ts = np.array(stamps, dtype="datetime64[us]")
+    except (ValueError, TypeError):
+        return [r for r, stamp in zip(wounds, stamps) if _within_cutoff(stamp, cutoff)]
+
+    # If timestamp invalid, include it (conservative)
+    keep = np.isnat(ts) | (ts >= np.datetime64(cutoff, "us"))
+    return [r for r, k in zip(wounds, keep.tolist()) if k]
+
+
+@functools.lru_cache(maxsize=256)
+def _is_wound_type(receipt_type: str) -> bool:
+    """Whether a receipt type counts as a wound; the set of types is small."""
+    return "wound" in receipt_type or "anomaly" in receipt_type or "violation" in receipt_type
+
 
-    return wounds
+def _within_cutoff(stamp: str, cutoff: datetime) -> bool:
+    """Per-receipt fallback when a batch of timestamps can't be parsed together."""
+    try:
+        return datetime.fromisoformat(stamp) >= cutoff
+    except (ValueError, TypeError):
+        # If timestamp invalid, include it (conservative)
+        return True
 
 
 def identify_patterns(wounds: list) -> list:
@@ -69,16 +88,25 @@ def identify_patterns(wounds: list) -> list:
     # Analyze each group
     for wound_type, group in type_groups.items():
         if len(group) >= GENESIS_AUTOCATALYSIS_THRESHOLD:
-            # Calculate statistics
-            amounts = [w.get("amount_usd", 0) for w in group if w.get("amount_usd")]
-            probabilities = [w.get("fraud_probability", 0) for w in group if w.get("fraud_probability")]
+            # Calculate statistics in one pass, reading each field once
+            amounts = []
+            probabilities = []
+            stamps = []
+            for w in group:
+                stamps.append(w.get("ts", ""))
+                amount = w.get("amount_usd")
+                if amount:
+                    amounts.append(amount)
+                probability = w.get("fraud_probability")
+                if probability:
+                    probabilities.append(probability)
 
             pattern = {
                 "pattern_id": f"pattern-{uuid.uuid4().hex[:8]}",
                 "wound_type": wound_type,
                 "occurrence_count": len(group),
-                "first_occurrence": min(w.get("ts", "") for w in group),
-                "last_occurrence": max(w.get("ts", "") for w in group),
+                "first_occurrence": min(stamps),
+                "last_occurrence": max(stamps),
                 "avg_amount_usd": sum(amounts) / len(amounts) if amounts else 0,
                 "avg_fraud_probability": sum(probabilities) / len(probabilities) if probabilities else 0,
                 "sample_wounds": group[:5],  # Keep first 5 as samples
@@ -147,7 +175,12 @@ def emit_genesis_receipt(blueprint: dict) -> dict:
     Returns:
         Genesis birth receipt
     """
-    return emit_receipt("genesis_birth", {
+    return emit_receipt("genesis_birth", _genesis_birth_payload(blueprint))
+
+
+def _genesis_birth_payload(blueprint: dict) -> dict:
+    """genesis_birth receipt payload for an activated blueprint."""
+    return {
         "tenant_id": TENANT_ID,
         "watcher_id": blueprint.get("id"),
         "pattern_name": blueprint.get("pattern_name"),
@@ -156,7 +189,7 @@ def emit_genesis_receipt(blueprint: dict) -> dict:
         "probability_threshold": blueprint.get("probability_threshold"),
         "source_pattern_id": blueprint.get("pattern_id"),
         "birth_time": datetime.utcnow().isoformat() + "Z"
-    })
+    }
 
 
 def run_genesis_cycle(receipts: list, existing_watchers: list = None) -> dict:
@@ -193,7 +226,8 @@ def run_genesis_cycle(receipts: list, existing_watchers: list = None) -> dict:
     results["patterns_identified"] = len(patterns)
     results["patterns"] = patterns
 
-    # Synthesize watchers for new patterns
+    # Synthesize watchers for new patterns; birth receipts go out together
+    births = []
     for pattern in patterns:
         if pattern.get("exceeds_threshold"):
             pattern_name = f"genesis_{pattern.get('wound_type', 'unknown')}"
@@ -209,8 +243,10 @@ def run_genesis_cycle(receipts: list, existing_watchers: list = None) -> dict:
             results["new_watchers"].append(blueprint)
             results["watchers_spawned"] += 1
 
-            # Emit birth receipt
-            emit_genesis_receipt(blueprint)
+            births.append(("genesis_birth", _genesis_birth_payload(blueprint)))
+
+    # Emit birth receipts
+    emit_receipts_batch(births)
 
     return results
 
@@ -236,17 +272,20 @@ def detect_emerging_scandal(
     ]
 
     emerging_scandals = []
+    scandal_receipts = []
 
-    # Group receipts by entity
-    entity_receipts = defaultdict(list)
+    # Group receipts by entity, keeping only per-type counts; indicators are
+    # then matched against each entity's few distinct types, not every receipt
+    entity_type_counts = defaultdict(Counter)
     for r in receipts:
         entity = r.get("entity", r.get("contractor_name", r.get("trust_name", "unknown")))
-        entity_receipts[entity].append(r)
+        entity_type_counts[entity][r.get("receipt_type", "").lower()] += 1
 
     # Check each entity for scandal indicators
-    for entity, entity_r in entity_receipts.items():
+    for entity, type_counts in entity_type_counts.items():
         scandal_score = 0.0
         indicators_found = []
+        receipt_count = sum(type_counts.values())
 
         for indicator in scandal_indicators:
             ind_type = indicator["type"]
@@ -254,7 +293,10 @@ def detect_emerging_scandal(
             weight = indicator["weight"]
 
             # Count matching receipts
-            matches = sum(1 for r in entity_r if ind_type in r.get("receipt_type", "").lower())
+            matches = sum(
+                count for receipt_type, count in type_counts.items()
+                if ind_type in receipt_type
+            )
 
             if matches >= threshold:
                 scandal_score += weight
@@ -269,17 +311,19 @@ def detect_emerging_scandal(
                 "entity": entity,
                 "scandal_score": scandal_score,
                 "indicators": indicators_found,
-                "receipt_count": len(entity_r),
+                "receipt_count": receipt_count,
                 "detected_at": datetime.utcnow().isoformat() + "Z"
             })
 
-            emit_receipt("emerging_scandal", {
+            scandal_receipts.append(("emerging_scandal", {
                 "tenant_id": TENANT_ID,
                 "entity": entity,
                 "scandal_score": scandal_score,
                 "indicator_count": len(indicators_found),
-                "receipt_count": len(entity_r)
-            })
+                "receipt_count": receipt_count
+            }))
+
+    emit_receipts_batch(scandal_receipts)
 
     return emerging_scandals
 
@@ -10,9 +10,14 @@ Key data:
 - IGT fined $180,000 for prohibited contributions to legislative caucuses
 """
 
+import random
+import re
 from typing import Any
 
+import numpy as np
+
 from .core import (
+    _canonical_json,
     emit_receipt,
     dual_hash,
     TENANT_ID,
@@ -20,6 +25,10 @@ from .core import (
 )
 
 
+# Recipient types closed to state contractors
+CONTRACTOR_CAUCUS_TYPES = frozenset({"caucus", "legislative_caucus"})
+
+
 def ingest_contribution(contribution: dict) -> dict:
     """
     Ingest political contribution.
@@ -54,7 +63,7 @@ def ingest_contribution(contribution: dict) -> dict:
         "recipient": contribution.get("recipient", "unknown"),
         "amount_usd": contribution.get("amount_usd", 0),
         "flag_count": len(flags),
-        "payload_hash": dual_hash(str(contribution))
+        "payload_hash": dual_hash(_canonical_json(contribution))
     })
 
     return enriched
@@ -78,28 +87,21 @@ def detect_prohibited_recipient(
     prohibited_contributions = []
 
     for c in contributions:
-        recipient = c.get("recipient", "").lower()
-        recipient_type = c.get("recipient_type", "").lower()
-        is_contractor = c.get("is_state_contractor", False)
-
-        is_prohibited = False
         reasons = []
 
         # Check if recipient or type is in prohibited list
-        if recipient in prohibited_set or recipient_type in prohibited_set:
-            is_prohibited = True
+        recipient_type = c.get("recipient_type", "").lower()
+        if recipient_type in prohibited_set or c.get("recipient", "").lower() in prohibited_set:
             reasons.append("recipient_prohibited")
 
         # State contractors have additional restrictions
-        if is_contractor:
-            if recipient_type in ["caucus", "legislative_caucus"]:
-                is_prohibited = True
+        if c.get("is_state_contractor", False):
+            if recipient_type in CONTRACTOR_CAUCUS_TYPES:
                 reasons.append("contractor_caucus_contribution")
-            if recipient_type == "pac" and c.get("pac_type") == "political":
-                is_prohibited = True
+            elif recipient_type == "pac" and c.get("pac_type") == "political":
                 reasons.append("contractor_political_pac")
 
-        if is_prohibited:
+        if reasons:
             prohibited_contributions.append({
                 **c,
                 "is_prohibited": True,
@@ -159,15 +161,31 @@ def detect_contractor_status(
             contractors.add(contractor_name.replace(" llc", ""))
             contractors.add(contractor_name.replace(" corp", ""))
 
-    # Enrich contributions
+    # One alternation finds any contractor inside a contributor name; one
+    # joined string finds a contributor inside any contractor name
+    contractor_pattern = (
+        re.compile("|".join(re.escape(name) for name in contractors))
+        if contractors else None
+    )
+    joined_contractors = "\0".join(contractors)
+
+    def _matches(contributor: str) -> bool:
+        if contractor_pattern is None:
+            return False
+        return (
+            contributor in contractors or
+            contractor_pattern.search(contributor) is not None or
+            ("\0" not in contributor and contributor in joined_contractors)
+        )
+
+    # Enrich contributions; contributors repeat, so match each name once
+    matched = {}
     enriched = []
     for c in contributions:
         contributor = c.get("contributor", "").lower()
-        is_contractor = (
-            contributor in contractors or
-            any(contractor in contributor for contractor in contractors) or
-            any(contributor in contractor for contractor in contractors)
-        )
+        is_contractor = matched.get(contributor)
+        if is_contractor is None:
+            is_contractor = matched[contributor] = _matches(contributor)
 
         enriched.append({
             **c,
@@ -270,8 +288,6 @@ def generate_synthetic_lottery_data(
     Returns:
         Tuple of (contributions, contracts)
     """
-    import random
-
     companies = [
         "IGT", "Scientific Games", "Pollard Banknote", "Intralot",
         "Tech Corp", "Services Inc", "Solutions LLC", "Consulting Group"
@@ -286,43 +302,53 @@ def generate_synthetic_lottery_data(
         ("State Senator Campaign", "campaign")
     ]
 
+    # Draw every column in one call; seeding from the global random stream
+    # keeps random.seed() reproducibility for the scenarios
+    rng = np.random.default_rng(random.getrandbits(64))
+
     # Generate contracts
-    contracts = []
-    for i in range(n_contracts):
-        contracts.append({
+    contractor_idx = rng.integers(0, 4, size=n_contracts)  # First 4 are contractors
+    contract_amounts = rng.uniform(100000, 10000000, size=n_contracts)
+    is_lottery = rng.random(n_contracts) < 0.5
+
+    contracts = [
+        {
             "id": f"CONTRACT-{i:06d}",
-            "contractor": random.choice(companies[:4]),  # First 4 are contractors
-            "amount_usd": random.uniform(100000, 10000000),
-            "type": "state_lottery" if random.random() < 0.5 else "general"
-        })
+            "contractor": companies[company],
+            "amount_usd": amount,
+            "type": "state_lottery" if lottery else "general"
+        }
+        for i, (company, amount, lottery) in enumerate(zip(
+            contractor_idx.tolist(), contract_amounts.tolist(), is_lottery.tolist()
+        ))
+    ]
+
+    # Generate contributions; violations come from contractors (first 4),
+    # the rest from non-contractors
+    is_violation = rng.random(n_contributions) < violation_rate
+    recipient_idx = rng.integers(0, len(recipients), size=n_contributions)
+    contributor_idx = rng.integers(0, 4, size=n_contributions) + np.where(is_violation, 0, 4)
+    amounts = rng.uniform(
+        np.where(is_violation, 5000, 500),
+        np.where(is_violation, 50000, 10000)
+    )
+    months = rng.integers(1, 13, size=n_contributions)
+    days = rng.integers(1, 29, size=n_contributions)
 
-    # Generate contributions
     contributions = []
-    for i in range(n_contributions):
-        is_violation = random.random() < violation_rate
-        recipient_name, recipient_type = random.choice(recipients)
-
-        if is_violation:
-            contribution = {
-                "id": f"CONTRIB-{i:06d}",
-                "contributor": random.choice(companies[:4]),  # Contractor
-                "recipient": recipient_name,
-                "recipient_type": recipient_type,
-                "amount_usd": random.uniform(5000, 50000),
-                "date": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-                "is_synthetic_violation": True
-            }
-        else:
-            contribution = {
-                "id": f"CONTRIB-{i:06d}",
-                "contributor": random.choice(companies[4:]),  # Non-contractor
-                "recipient": recipient_name,
-                "recipient_type": recipient_type,
-                "amount_usd": random.uniform(500, 10000),
-                "date": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-                "is_synthetic_violation": False
-            }
-
-        contributions.append(contribution)
+    for i, (violation, recipient, company, amount, month, day) in enumerate(zip(
+        is_violation.tolist(), recipient_idx.tolist(), contributor_idx.tolist(),
+        amounts.tolist(), months.tolist(), days.tolist()
+    )):
+        recipient_name, recipient_type = recipients[recipient]
+        contributions.append({
+            "id": f"CONTRIB-{i:06d}",
+            "contributor": companies[company],
+            "recipient": recipient_name,
+            "recipient_type": recipient_type,
+            "amount_usd": amount,
+            "date": f"2024-{month:02d}-{day:02d}",
+            "is_synthetic_violation": violation
+        })
 
     return contributions, contracts
@@ -10,10 +10,19 @@ $11B+ spent, including:
 - TDCJ diversion: $359.6M shifted from prisons
 """
 
+import bisect
+import functools
+import random
+import sys
+from collections import defaultdict
 from typing import Any
 
+import numpy as np
+
 from .core import (
+    _canonical_json,
     emit_receipt,
+    ReceiptBuffer,
     dual_hash,
     TENANT_ID,
     EMERGENCY_CONTRACT_HIGH_RISK,
@@ -23,7 +32,14 @@ from .core import (
     WYNNE_COST_PER_PASSENGER,
     TDCJ_DIVERSION_2022_USD,
 )
-from .entropy import contract_entropy, entropy_fraud_score
+from .entropy import _entropy_fraud_score_from, contract_entropy
+
+# Try to import numba, fallback to NumPy if not available
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 
 def ingest_contract(contract: dict) -> dict:
@@ -36,16 +52,19 @@ def ingest_contract(contract: dict) -> dict:
     Returns:
         Enriched contract with entropy and fraud scores
     """
-    # Compute entropy score
+    # Compute entropy score once and serialize once; the fraud score and the
+    # receipt hash share the same canonical bytes
     entropy = contract_entropy(contract)
-    fraud_score = entropy_fraud_score(contract)
+    contract_json = _canonical_json(contract)
+    fraud_score = _entropy_fraud_score_from(entropy, contract_json)
 
     # Enrich contract
     enriched = {
         **contract,
         "entropy_score": entropy,
         "fraud_probability": fraud_score,
-        "ingested": True
+        "ingested": True,
+        "_name_lc": _contract_name_lc(contract)
     }
 
     # Emit receipt
@@ -54,12 +73,28 @@ def ingest_contract(contract: dict) -> dict:
         "source_type": "ols_contract",
         "contract_name": contract.get("name", "unknown"),
         "amount_usd": contract.get("amount_usd", 0),
-        "payload_hash": dual_hash(str(contract))
+        "payload_hash": dual_hash(contract_json)
     })
 
     return enriched
 
 
+def _contract_name_lc(contract: dict) -> str:
+    """Interned lowercased contractor name, reusing the enriched field if set."""
+    name_lc = contract.get("_name_lc")
+    if name_lc is None:
+        name_lc = sys.intern(contract.get("name", "").lower())
+    return name_lc
+
+
+def _char_signature(text: str) -> int:
+    """64-bit bitmap of the characters in text (ord mod 64)."""
+    sig = 0
+    for ch in set(text):
+        sig |= 1 << (ord(ch) & 63)
+    return sig
+
+
 def detect_emergency_loop(contracts: list, donations: list) -> list:
     """
     Find contractor→donor→contract cycles.
@@ -79,37 +114,61 @@ def detect_emergency_loop(contracts: list, donations: list) -> list:
     """
     loops = []
 
-    # Build contractor→donation mapping
+    # Index contracts by lowercased contractor name (indices stay ascending)
+    contractor_names = [_contract_name_lc(contract) for contract in contracts]
+    contract_indices = defaultdict(list)
+    for i, contractor in enumerate(contractor_names):
+        contract_indices[contractor].append(i)
+
+    # Build contractor→donation mapping, matching each distinct donor name
+    # against each distinct contractor name once. Substring containment needs
+    # the shorter name's characters to be a subset of the longer one's, so a
+    # character-bitmap signature rejects most pairs before the real check
+    contractors = list(contract_indices)
+    contractor_sigs = np.fromiter(
+        map(_char_signature, contractors), dtype=np.uint64, count=len(contractors)
+    )
     contractor_donations = {}
+    donor_matches = {}
     for donation in donations:
         donor = donation.get("donor", "").lower()
-        for contract in contracts:
-            contractor = contract.get("name", "").lower()
+        matched = donor_matches.get(donor)
+        if matched is None:
+            donor_sig = np.uint64(_char_signature(donor))
+            common = contractor_sigs & donor_sig
+            candidates = np.flatnonzero((common == contractor_sigs) | (common == donor_sig))
             # Check if donor is contractor or affiliate
-            if contractor in donor or donor in contractor:
-                if contractor not in contractor_donations:
-                    contractor_donations[contractor] = []
-                contractor_donations[contractor].append(donation)
+            matched = donor_matches[donor] = [
+                contractor for contractor in map(contractors.__getitem__, candidates.tolist())
+                if contractor in donor or donor in contractor
+            ]
+        for contractor in matched:
+            # One entry per contract held by the contractor, as before
+            contractor_donations.setdefault(contractor, []).extend(
+                [donation] * len(contract_indices[contractor])
+            )
 
     # Find loops: emergency contract + donation + subsequent contract
     for i, contract in enumerate(contracts):
-        contractor = contract.get("name", "").lower()
-        contract_type = contract.get("contract_type", "").lower()
+        contractor = contractor_names[i]
+        is_emergency, _, is_hyphen_no_bid = _contract_type_flags(
+            contract.get("contract_type", "")
+        )
 
-        if "emergency" in contract_type or "no-bid" in contract_type:
+        if is_emergency or is_hyphen_no_bid:
             # Check for donations from this contractor
             if contractor in contractor_donations:
                 # Check for subsequent contracts to same contractor
-                for j, subsequent in enumerate(contracts):
-                    if j > i and subsequent.get("name", "").lower() == contractor:
-                        loops.append({
-                            "contractor": contractor,
-                            "initial_contract": contract,
-                            "donations": contractor_donations[contractor],
-                            "subsequent_contract": subsequent,
-                            "loop_type": "emergency→donor→contract",
-                            "risk_score": 0.9
-                        })
+                indices = contract_indices[contractor]
+                for j in indices[bisect.bisect_right(indices, i):]:
+                    loops.append({
+                        "contractor": contractor,
+                        "initial_contract": contract,
+                        "donations": contractor_donations[contractor],
+                        "subsequent_contract": contracts[j],
+                        "loop_type": "emergency→donor→contract",
+                        "risk_score": 0.9
+                    })
 
     return loops
 
@@ -128,10 +187,12 @@ def score_contract_fraud(contract: dict, donor_network: dict) -> float:
     score = 0.0
 
     # Contract type factors
-    contract_type = contract.get("contract_type", "").lower()
-    if "emergency" in contract_type:
+    is_emergency, is_no_bid, is_hyphen_no_bid = _contract_type_flags(
+        contract.get("contract_type", "")
+    )
+    if is_emergency:
         score += 0.3
-    if "no-bid" in contract_type or "no_bid" in contract_type:
+    if is_no_bid:
         score += 0.25
 
     # Cost anomaly
@@ -146,7 +207,7 @@ def score_contract_fraud(contract: dict, donor_network: dict) -> float:
             score += 0.15
 
     # Donor correlation
-    contractor_name = contract.get("name", "").lower()
+    contractor_name = _contract_name_lc(contract)
     if contractor_name in donor_network:
         donation_total = donor_network[contractor_name].get("total_usd", 0)
         if donation_total > 100000:
@@ -155,12 +216,128 @@ def score_contract_fraud(contract: dict, donor_network: dict) -> float:
             score += 0.15
 
     # Large contract without oversight
-    if amount > 50_000_000 and "no-bid" in contract_type:
+    if amount > 50_000_000 and is_hyphen_no_bid:
         score += 0.1
 
     return min(1.0, score)
 
 
+def score_contract_fraud_batch(contracts: list, donor_network: dict) -> np.ndarray:
+    """
+    Vectorized score_contract_fraud over many contracts.
+
+    Fields are gathered once into structure-of-arrays form and each factor is
+    applied as a whole-array mask, in the same order as the scalar version, so
+    results match it element-wise.
+
+    Args:
+        contracts: List of contract dicts
+        donor_network: Dict mapping contractors to donation info
+
+    Returns:
+        Array of fraud probabilities 0-1
+    """
+    n = len(contracts)
+
+    type_flags = np.array(
+        [_contract_type_flags(c.get("contract_type", "")) for c in contracts],
+        dtype=bool
+    ).reshape(n, 3)
+    amount = np.fromiter((c.get("amount_usd", 0) for c in contracts), dtype=np.float64, count=n)
+    cost_per_unit = np.fromiter(
+        (c.get("cost_per_unit_usd", 0) for c in contracts), dtype=np.float64, count=n
+    )
+    market_rate = np.fromiter(
+        (c.get("market_rate_usd", c.get("cost_per_unit_usd", 0)) for c in contracts),
+        dtype=np.float64, count=n
+    )
+    donation_total = np.fromiter(
+        (
+            donor_network[name].get("total_usd", 0) if name in donor_network else 0
+            for name in map(_contract_name_lc, contracts)
+        ),
+        dtype=np.float64, count=n
+    )
+
+    if HAS_NUMBA:
+        return _score_kernel(type_flags, cost_per_unit, market_rate, donation_total, amount)
+    return _score_arrays(type_flags, cost_per_unit, market_rate, donation_total, amount)
+
+
+def _score_arrays(type_flags, cost_per_unit, market_rate, donation_total, amount):
+    """NumPy scoring over structure-of-arrays contract fields."""
+    score = np.zeros(len(amount))
+
+    # Contract type factors
+    score += np.where(type_flags[:, 0], 0.3, 0.0)
+    score += np.where(type_flags[:, 1], 0.25, 0.0)
+
+    # Cost anomaly
+    priced = (cost_per_unit > 0) & (market_rate > 0)
+    score += np.where(
+        priced & (cost_per_unit > market_rate * 3), 0.25,
+        np.where(priced & (cost_per_unit > market_rate * 2), 0.15, 0.0)
+    )
+
+    # Donor correlation
+    score += np.where(donation_total > 100000, 0.3, np.where(donation_total > 10000, 0.15, 0.0))
+
+    # Large contract without oversight
+    score += np.where((amount > 50_000_000) & type_flags[:, 2], 0.1, 0.0)
+
+    return np.minimum(1.0, score)
+
+
+if HAS_NUMBA:
+    # Explicit signature: compiled once at import, not on first call
+    @njit("float64[:](boolean[:, :], float64[:], float64[:], float64[:], float64[:])", cache=True)
+    def _score_kernel(type_flags, cost_per_unit, market_rate, donation_total, amount):
+        """Compiled _score_arrays: one fused loop, no temporary arrays."""
+        n = amount.shape[0]
+        score = np.empty(n)
+        for i in range(n):
+            s = 0.0
+            if type_flags[i, 0]:
+                s += 0.3
+            if type_flags[i, 1]:
+                s += 0.25
+            cost = cost_per_unit[i]
+            market = market_rate[i]
+            if cost > 0 and market > 0:
+                if cost > market * 3:
+                    s += 0.25
+                elif cost > market * 2:
+                    s += 0.15
+            total = donation_total[i]
+            if total > 100000:
+                s += 0.3
+            elif total > 10000:
+                s += 0.15
+            if amount[i] > 50_000_000 and type_flags[i, 2]:
+                s += 0.1
+            if s > 1.0:
+                s = 1.0
+            score[i] = s
+        return score
+
+
+@functools.lru_cache(maxsize=256)
+def _contract_type_flags(contract_type: str) -> tuple:
+    """
+    (emergency, no-bid or no_bid, literal no-bid) for a contract type.
+
+    Contract types are a small vocabulary, so each distinct string is
+    lowercased and scanned once; every later test is a cache hit.
+    """
+    contract_type = contract_type.lower()
+    is_hyphen_no_bid = "no-bid" in contract_type
+    return (
+        "emergency" in contract_type,
+        is_hyphen_no_bid or "no_bid" in contract_type,
+        is_hyphen_no_bid
+    )
+
+
 def detect_fund_diversion(source_budget: dict, dest_spend: dict) -> list:
     """
     Detect TDCJ→OLS-style fund diversions.
@@ -173,34 +350,46 @@ def detect_fund_diversion(source_budget: dict, dest_spend: dict) -> list:
         List of diversion_receipts
     """
     diversions = []
+    if not source_budget or not dest_spend:
+        return diversions
 
-    for source, budget_info in source_budget.items():
+    sources = list(source_budget.items())
+    diverted = []
+    for _, budget_info in sources:
         original = budget_info.get("original_usd", 0)
-        actual = budget_info.get("actual_usd", original)
-        diverted = original - actual
-
-        if diverted > 10_000_000:  # $10M threshold
-            # Find destination
-            for dest, spend_info in dest_spend.items():
-                original_dest = spend_info.get("original_usd", 0)
-                actual_dest = spend_info.get("actual_usd", original_dest)
-                increase = actual_dest - original_dest
-
-                # Check if diversion matches destination increase
-                if abs(diverted - increase) / max(diverted, 1) < 0.2:  # 20% tolerance
-                    diversion = {
-                        "source": source,
-                        "destination": dest,
-                        "amount_usd": diverted,
-                        "source_impact": budget_info.get("impact", "unknown"),
-                        "correlation": 1 - abs(diverted - increase) / max(diverted, 1)
-                    }
-                    diversions.append(diversion)
-
-                    emit_receipt("fund_diversion", {
-                        "tenant_id": TENANT_ID,
-                        **diversion
-                    })
+        diverted.append(original - budget_info.get("actual_usd", original))
+
+    dests = list(dest_spend.items())
+    increases = []
+    for _, spend_info in dests:
+        original_dest = spend_info.get("original_usd", 0)
+        increases.append(spend_info.get("actual_usd", original_dest) - original_dest)
+
+    # Relative mismatch of every source diversion against every destination
+    # increase, as one (sources x destinations) matrix
+    diverted_arr = np.array(diverted, dtype=np.float64)
+    mismatch = (
+        np.abs(diverted_arr[:, None] - np.array(increases, dtype=np.float64)[None, :])
+        / np.maximum(diverted_arr, 1)[:, None]
+    )
+
+    # $10M threshold, 20% tolerance; nonzero() keeps source-major order
+    matches = (diverted_arr > 10_000_000)[:, None] & (mismatch < 0.2)
+    for i, j in zip(*np.nonzero(matches)):
+        source, budget_info = sources[i]
+        diversion = {
+            "source": source,
+            "destination": dests[j][0],
+            "amount_usd": diverted[i],
+            "source_impact": budget_info.get("impact", "unknown"),
+            "correlation": float(1 - mismatch[i, j])
+        }
+        diversions.append(diversion)
+
+        emit_receipt("fund_diversion", {
+            "tenant_id": TENANT_ID,
+            **diversion
+        })
 
     return diversions
 
@@ -248,29 +437,34 @@ def analyze_ols_contractors(contracts: list, donations: list) -> dict:
     # Build donor network
     donor_network = {}
     for donation in donations:
-        donor = donation.get("donor", "").lower()
+        donor = sys.intern(donation.get("donor", "").lower())
         if donor not in donor_network:
             donor_network[donor] = {"total_usd": 0, "donations": []}
         donor_network[donor]["total_usd"] += donation.get("amount", 0)
         donor_network[donor]["donations"].append(donation)
 
-    # Analyze each contract
-    for contract in contracts:
-        enriched = ingest_contract(contract)
-        fraud_score = score_contract_fraud(contract, donor_network)
-
-        if fraud_score >= EMERGENCY_CONTRACT_HIGH_RISK:
-            results["high_risk_count"] += 1
-
-        receipt = emit_ols_receipt({
-            "contractor_name": contract.get("name"),
-            "contract_amount_usd": contract.get("amount_usd", 0),
-            "contract_type": contract.get("contract_type"),
-            "donor_correlation": enriched.get("entropy_score", 0),
-            "fund_diversion_detected": False,
-            "fraud_probability": fraud_score
-        })
-        results["receipts"].append(receipt)
+    # Analyze each contract (fraud scores in one vectorized pass); receipts
+    # are written to the ledger in batches, in contract order
+    fraud_scores = score_contract_fraud_batch(contracts, donor_network).tolist()
+    with ReceiptBuffer():
+        for contract, fraud_score in zip(contracts, fraud_scores):
+            enriched = ingest_contract(contract)
+
+            if fraud_score >= EMERGENCY_CONTRACT_HIGH_RISK:
+                results["high_risk_count"] += 1
+
+            # Payload is complete, so emit it directly rather than through
+            # emit_ols_receipt's per-field default copy
+            receipt = emit_receipt("ols_contractor", {
+                "tenant_id": TENANT_ID,
+                "contractor_name": contract.get("name"),
+                "contract_amount_usd": contract.get("amount_usd", 0),
+                "contract_type": contract.get("contract_type"),
+                "donor_correlation": enriched.get("entropy_score", 0),
+                "fund_diversion_detected": False,
+                "fraud_probability": fraud_score
+            })
+            results["receipts"].append(receipt)
 
     # Detect loops
     results["loops_detected"] = detect_emergency_loop(contracts, donations)
@@ -289,8 +483,6 @@ def generate_synthetic_ols_contracts(n: int, fraud_rate: float = 0.2) -> list:
     Returns:
         List of synthetic contract dicts
     """
-    import random
-
     contractors = [
         "Gothams", "Wynne Transportation", "BorderGuard LLC",
         "Lone Star Security", "Texas Shield Inc", "Frontier Services",
@@ -298,33 +490,42 @@ def generate_synthetic_ols_contracts(n: int, fraud_rate: float = 0.2) -> list:
         "Sentinel Operations"
     ]
 
-    contracts = []
-    for i in range(n):
-        is_fraud = random.random() < fraud_rate
-
-        if is_fraud:
-            contract = {
-                "id": f"OLS-{i:06d}",
-                "name": random.choice(contractors[:3]),  # Known problematic
-                "amount_usd": random.uniform(10_000_000, 100_000_000),
-                "contract_type": random.choice(["emergency", "emergency/no-bid", "no-bid"]),
-                "cost_per_unit_usd": random.uniform(1500, 2500),
-                "market_rate_usd": 500,
-                "year": random.randint(2021, 2025),
-                "is_synthetic_fraud": True
-            }
-        else:
-            contract = {
-                "id": f"OLS-{i:06d}",
-                "name": random.choice(contractors[3:]),
-                "amount_usd": random.uniform(100_000, 5_000_000),
-                "contract_type": random.choice(["competitive", "rfp", "competitive bid"]),
-                "cost_per_unit_usd": random.uniform(400, 600),
-                "market_rate_usd": 500,
-                "year": random.randint(2021, 2025),
-                "is_synthetic_fraud": False
-            }
-
-        contracts.append(contract)
+    # Fraudulent types first, then legitimate ones
+    contract_types = [
+        "emergency", "emergency/no-bid", "no-bid",
+        "competitive", "rfp", "competitive bid"
+    ]
+
+    # Draw every column in one call; seeding from the global random stream
+    # keeps random.seed() reproducibility for the scenarios
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    is_fraud = rng.random(n) < fraud_rate
+    # Fraud goes to the first 3 contractors (known problematic), the rest to the other 7
+    name_idx = np.where(is_fraud, rng.integers(0, 3, size=n), rng.integers(3, 10, size=n))
+    amounts = rng.uniform(
+        np.where(is_fraud, 10_000_000, 100_000),
+        np.where(is_fraud, 100_000_000, 5_000_000)
+    )
+    type_idx = rng.integers(0, 3, size=n) + np.where(is_fraud, 0, 3)
+    cost_per_unit = rng.uniform(np.where(is_fraud, 1500, 400), np.where(is_fraud, 2500, 600))
+    years = rng.integers(2021, 2026, size=n)
+
+    contracts = [
+        {
+            "id": f"OLS-{i:06d}",
+            "name": contractors[name],
+            "amount_usd": amount,
+            "contract_type": contract_types[contract_type],
+            "cost_per_unit_usd": cost,
+            "market_rate_usd": 500,
+            "year": year,
+            "is_synthetic_fraud": fraud
+        }
+        for i, (fraud, name, amount, contract_type, cost, year) in enumerate(zip(
+            is_fraud.tolist(), name_idx.tolist(), amounts.tolist(),
+            type_idx.tolist(), cost_per_unit.tolist(), years.tolist()
+        ))
+    ]
 
     return contracts
@@ -10,10 +10,15 @@ $14M+ Dunn/Wilks donations:
 - Texans United: $3M targeting Paxton impeachment voters
 """
 
+import random
 from typing import Any
 
+import numpy as np
+
 from .core import (
+    _canonical_json,
     emit_receipt,
+    ReceiptBuffer,
     dual_hash,
     TENANT_ID,
     PAC_CAPTURE_HIGH_RISK,
@@ -45,7 +50,7 @@ def ingest_pac_filing(filing: dict) -> dict:
         "source_type": "pac_filing",
         "pac_name": filing.get("pac_name", "unknown"),
         "total_usd": filing.get("total_usd", 0),
-        "payload_hash": dual_hash(str(filing))
+        "payload_hash": dual_hash(_canonical_json(filing))
     })
 
     return enriched
@@ -69,40 +74,70 @@ def trace_donor_to_policy(
     Returns:
         Influence chain dict
     """
+    donor_lower = donor.lower()
+    donor_donations = [d for d in donations if d.get("donor", "").lower() == donor_lower]
+    return _trace_chain(
+        donor, donor_donations, _index_votes_by_pac(votes), _index_policies_by_beneficiary(policies)
+    )
+
+
+def _donation_amounts(donations: list) -> np.ndarray:
+    """Donation amounts as a float64 array, in donation order."""
+    return np.fromiter(
+        (d.get("amount", 0) for d in donations), dtype=np.float64, count=len(donations)
+    )
+
+
+def _index_votes_by_pac(votes: list) -> dict:
+    """Map each funding PAC to the positions of the votes it funded."""
+    votes_by_pac = {}
+    for i, vote in enumerate(votes):
+        votes_by_pac.setdefault(vote.get("funded_by_pac", ""), []).append((i, vote))
+    return votes_by_pac
+
+
+def _index_policies_by_beneficiary(policies: list) -> dict:
+    """Map each lowercased beneficiary to the policies naming it, in policy order."""
+    policies_by_beneficiary = {}
+    for policy in policies:
+        for beneficiary in {b.lower() for b in policy.get("beneficiaries", [])}:
+            policies_by_beneficiary.setdefault(beneficiary, []).append(policy)
+    return policies_by_beneficiary
+
+
+def _trace_chain(
+    donor: str,
+    donor_donations: list,
+    votes_by_pac: dict,
+    policies_by_beneficiary: dict,
+    total_donated: float = None
+) -> dict:
+    """trace_donor_to_policy over a donor's pre-grouped donations and indexed votes/policies."""
     chain = {
         "donor": donor,
-        "donations": [],
+        "donations": list(donor_donations),
         "influenced_votes": [],
         "aligned_policies": [],
         "capture_probability": 0.0
     }
 
-    # Find donations from this donor
-    donor_lower = donor.lower()
-    total_donated = 0
-    pacs_funded = set()
-
-    for d in donations:
-        if d.get("donor", "").lower() == donor_lower:
-            chain["donations"].append(d)
-            total_donated += d.get("amount", 0)
-            pacs_funded.add(d.get("pac_name", ""))
+    # Total donations from this donor
+    if total_donated is None:
+        total_donated = float(_donation_amounts(donor_donations).sum())
+    pacs_funded = {d.get("pac_name", "") for d in donor_donations}
 
     chain["total_donated_usd"] = total_donated
     chain["pacs_funded"] = list(pacs_funded)
 
-    # Find votes influenced by these PACs
-    for vote in votes:
-        # Check if PAC recipients voted in donor's interest
-        voter_pac = vote.get("funded_by_pac", "")
-        if voter_pac in pacs_funded:
-            chain["influenced_votes"].append(vote)
+    # Find votes influenced by these PACs, in original vote order
+    influenced = []
+    for pac in pacs_funded:
+        influenced.extend(votes_by_pac.get(pac, ()))
+    influenced.sort(key=lambda item: item[0])
+    chain["influenced_votes"] = [vote for _, vote in influenced]
 
     # Find policies that align with donor interests
-    for policy in policies:
-        beneficiaries = policy.get("beneficiaries", [])
-        if donor_lower in [b.lower() for b in beneficiaries]:
-            chain["aligned_policies"].append(policy)
+    chain["aligned_policies"] = list(policies_by_beneficiary.get(donor.lower(), ()))
 
     # Compute capture probability
     if total_donated > 1_000_000:
@@ -121,7 +156,7 @@ def trace_donor_to_policy(
         policy_influence = min(0.2, len(chain["aligned_policies"]) * 0.1)
         base_prob += policy_influence
 
-    chain["capture_probability"] = min(1.0, base_prob)
+    chain["capture_probability"] = base_prob if base_prob < 1.0 else 1.0
 
     return chain
 
@@ -156,6 +191,11 @@ def detect_primary_purge(
             voter = vote.get("legislator", "").lower()
             impeach_voters[voter] = vote
 
+    # Index outcomes by lowercased incumbent (first record wins)
+    outcomes_by_incumbent = {}
+    for o in outcomes:
+        outcomes_by_incumbent.setdefault(o.get("incumbent", "").lower(), o)
+
     # Find challenges against impeachment voters
     for challenge in challenges:
         incumbent = challenge.get("incumbent", "").lower()
@@ -165,11 +205,7 @@ def detect_primary_purge(
 
         if incumbent in impeach_voters:
             # Find outcome
-            outcome = None
-            for o in outcomes:
-                if o.get("incumbent", "").lower() == incumbent:
-                    outcome = o
-                    break
+            outcome = outcomes_by_incumbent.get(incumbent)
 
             purge = {
                 "incumbent": incumbent,
@@ -208,13 +244,46 @@ def score_influence_capture(donations: list, policy_outcomes: list) -> float:
     capture_prob = 1.0 - entropy
 
     # Adjust based on donation magnitude
-    total_donations = sum(d.get("amount", 0) for d in donations)
+    total_donations = _donation_amounts(donations).sum()
     if total_donations > 10_000_000:
-        capture_prob = min(1.0, capture_prob + 0.2)
+        capture_prob += 0.2
     elif total_donations > 1_000_000:
-        capture_prob = min(1.0, capture_prob + 0.1)
+        capture_prob += 0.1
+    else:
+        return capture_prob
+
+    # Single inline clamp on the adjusted probability
+    return capture_prob if capture_prob < 1.0 else 1.0
+
 
-    return capture_prob
+def score_influence_capture_each(donations: list, policy_outcomes: list) -> np.ndarray:
+    """
+    score_influence_capture for each donation on its own, as one array.
+
+    For a single donation the donor→policy entropy is 0.0 when any outcome
+    names the donor as beneficiary or aligned donor, else 1.0, so each score
+    reduces to a membership test plus the donation magnitude bonus.
+
+    Args:
+        donations: List of donations
+        policy_outcomes: List of policy outcomes
+
+    Returns:
+        Array of capture probabilities 0-1, in donation order
+    """
+    n = len(donations)
+    if not n or not policy_outcomes:
+        return np.zeros(n)
+
+    aligned = set()
+    for o in policy_outcomes:
+        aligned.update((o.get("beneficiary"), o.get("aligned_donor")))
+
+    captured = np.fromiter((d.get("donor", "") in aligned for d in donations), dtype=bool, count=n)
+    amounts = _donation_amounts(donations)
+    bonus = np.where(amounts > 10_000_000, 0.2, np.where(amounts > 1_000_000, 0.1, 0.0))
+
+    return np.minimum(1.0, np.where(captured, 1.0, 0.0) + bonus)
 
 
 def emit_pac_receipt(findings: dict) -> dict:
@@ -266,35 +335,64 @@ def analyze_pac_influence(
         "receipts": []
     }
 
-    # Group donations by donor
+    # Group donations by donor in one pass; traces match donors
+    # case-insensitively, so keep a lowercased grouping for them too
     donors = {}
+    donations_by_lower = {}
+    donor_codes = []
+    lower_codes = []
     for d in donations:
         donor = d.get("donor", "unknown")
-        if donor not in donors:
-            donors[donor] = []
-        donors[donor].append(d)
-
-    # Trace each major donor
-    for donor, donor_donations in donors.items():
-        total = sum(d.get("amount", 0) for d in donor_donations)
-        if total > 100000:  # Only analyze significant donors
-            chain = trace_donor_to_policy(donor, donations, votes, policies)
-            results["donor_chains"].append(chain)
-
-            if chain["capture_probability"] >= PAC_CAPTURE_HIGH_RISK:
-                results["high_capture_count"] += 1
-
-            receipt = emit_pac_receipt({
-                "donor_name": donor,
-                "total_donated_usd": total,
-                "pac_name": donor_donations[0].get("pac_name", "unknown"),
-                "primary_challenges_funded": len(chain.get("influenced_votes", [])),
-                "successful_purges": len([p for p in results["purges_detected"] if p.get("purge_successful")]),
-                "vote_correlation": len(chain.get("influenced_votes", [])) / max(len(votes), 1),
-                "policy_alignment_score": len(chain.get("aligned_policies", [])) / max(len(policies), 1),
-                "capture_probability": chain["capture_probability"]
-            })
-            results["receipts"].append(receipt)
+        donor_codes.append(donors.setdefault(donor, (len(donors), []))[0])
+        donors[donor][1].append(d)
+        lower = d.get("donor", "").lower()
+        lower_codes.append(donations_by_lower.setdefault(lower, (len(donations_by_lower), []))[0])
+        donations_by_lower[lower][1].append(d)
+
+    # Per-donor totals as one weighted bincount over a single amounts array
+    amounts = _donation_amounts(donations)
+    donor_totals = np.bincount(donor_codes, weights=amounts, minlength=len(donors)).tolist()
+    lower_totals = np.bincount(
+        lower_codes, weights=amounts, minlength=len(donations_by_lower)
+    ).tolist()
+
+    votes_by_pac = _index_votes_by_pac(votes)
+    policies_by_beneficiary = _index_policies_by_beneficiary(policies)
+
+    # Loop-invariant receipt fields
+    successful_purges = len([p for p in results["purges_detected"] if p.get("purge_successful")])
+    vote_count = max(len(votes), 1)
+    policy_count = max(len(policies), 1)
+
+    # Trace each major donor; receipts are written to the ledger in batches
+    with ReceiptBuffer():
+        for donor, (code, donor_donations) in donors.items():
+            total = donor_totals[code]
+            if total > 100000:  # Only analyze significant donors
+                lower_code, lower_donations = donations_by_lower.get(donor.lower(), (None, []))
+                chain = _trace_chain(
+                    donor, lower_donations, votes_by_pac, policies_by_beneficiary,
+                    total_donated=lower_totals[lower_code] if lower_code is not None else 0
+                )
+                results["donor_chains"].append(chain)
+
+                if chain["capture_probability"] >= PAC_CAPTURE_HIGH_RISK:
+                    results["high_capture_count"] += 1
+
+                # Payload is complete, so emit it directly rather than through
+                # emit_pac_receipt's per-field default copy
+                receipt = emit_receipt("pac_influence", {
+                    "tenant_id": TENANT_ID,
+                    "donor_name": donor,
+                    "total_donated_usd": total,
+                    "pac_name": donor_donations[0].get("pac_name", "unknown"),
+                    "primary_challenges_funded": len(chain["influenced_votes"]),
+                    "successful_purges": successful_purges,
+                    "vote_correlation": len(chain["influenced_votes"]) / vote_count,
+                    "policy_alignment_score": len(chain["aligned_policies"]) / policy_count,
+                    "capture_probability": chain["capture_probability"]
+                })
+                results["receipts"].append(receipt)
 
     # Detect primary purges
     impeachment_votes = [v for v in votes if v.get("vote_type") == "impeachment"]
@@ -314,8 +412,6 @@ def generate_synthetic_pac_data(
     Returns:
         Tuple of (donations, challenges, votes, policies)
     """
-    import random
-
     donors = [
         "Tim Dunn", "Farris Wilks", "Dan Wilks", "Stacy Hock",
         "Michael Dell", "John Arnold", "Laura Arnold"
@@ -328,53 +424,98 @@ def generate_synthetic_pac_data(
 
     legislators = [f"Rep_{i}" for i in range(50)]
 
-    # Generate donations
-    donations = []
-    for i in range(n_donations):
-        is_capture = random.random() < capture_rate
-        donor = random.choice(donors[:2] if is_capture else donors[2:])
-
-        donations.append({
+    # Draw every column in one call; seeding from the global random stream
+    # keeps random.seed() reproducibility for the scenarios
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    # Generate donations; capture donations come from the first 2 donors and PACs
+    is_capture = rng.random(n_donations) < capture_rate
+    donor_idx = np.where(
+        is_capture,
+        rng.integers(0, 2, size=n_donations),
+        rng.integers(2, len(donors), size=n_donations)
+    )
+    amounts = rng.uniform(
+        np.where(is_capture, 100000, 1000),
+        np.where(is_capture, 1000000, 50000)
+    )
+    donation_pac_idx = rng.integers(0, 2, size=n_donations) + np.where(is_capture, 0, 2)
+    months = rng.integers(1, 13, size=n_donations)
+    days = rng.integers(1, 29, size=n_donations)
+
+    donations = [
+        {
             "id": f"DON-{i:06d}",
-            "donor": donor,
-            "amount": random.uniform(100000, 1000000) if is_capture else random.uniform(1000, 50000),
-            "pac_name": random.choice(pacs[:2] if is_capture else pacs[2:]),
-            "date": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-            "is_synthetic_capture": is_capture
-        })
+            "donor": donors[donor],
+            "amount": amount,
+            "pac_name": pacs[pac],
+            "date": f"2024-{month:02d}-{day:02d}",
+            "is_synthetic_capture": capture
+        }
+        for i, (capture, donor, amount, pac, month, day) in enumerate(zip(
+            is_capture.tolist(), donor_idx.tolist(), amounts.tolist(),
+            donation_pac_idx.tolist(), months.tolist(), days.tolist()
+        ))
+    ]
 
     # Generate challenges
-    challenges = []
-    for i in range(n_challenges):
-        is_purge = random.random() < capture_rate
-
-        challenges.append({
+    is_purge = rng.random(n_challenges) < capture_rate
+    incumbent_idx = rng.integers(0, len(legislators), size=n_challenges)
+    challenge_pac_idx = rng.integers(0, 2, size=n_challenges) + np.where(is_purge, 0, 2)
+    funding = rng.uniform(
+        np.where(is_purge, 200000, 10000),
+        np.where(is_purge, 500000, 50000)
+    )
+
+    challenges = [
+        {
             "id": f"CHAL-{i:06d}",
-            "incumbent": random.choice(legislators),
+            "incumbent": legislators[incumbent],
             "challenger": f"Challenger_{i}",
-            "pac_name": random.choice(pacs[:2] if is_purge else pacs[2:]),
-            "pac_funding_usd": random.uniform(200000, 500000) if is_purge else random.uniform(10000, 50000),
-            "is_synthetic_purge": is_purge
-        })
+            "pac_name": pacs[pac],
+            "pac_funding_usd": pac_funding,
+            "is_synthetic_purge": purge
+        }
+        for i, (purge, incumbent, pac, pac_funding) in enumerate(zip(
+            is_purge.tolist(), incumbent_idx.tolist(),
+            challenge_pac_idx.tolist(), funding.tolist()
+        ))
+    ]
 
     # Generate votes
-    votes = []
-    for leg in legislators[:20]:
-        votes.append({
+    n_votes = 20
+    votes_yes = rng.random(n_votes) < 0.5
+    vote_pac_idx = rng.integers(0, len(pacs), size=n_votes)
+    pac_funded = rng.random(n_votes) < 0.5
+
+    votes = [
+        {
             "legislator": leg,
             "vote_type": "impeachment",
-            "vote": random.choice(["yes", "no"]),
-            "funded_by_pac": random.choice(pacs) if random.random() < 0.5 else ""
-        })
+            "vote": "yes" if yes else "no",
+            "funded_by_pac": pacs[pac] if funded else ""
+        }
+        for leg, yes, pac, funded in zip(
+            legislators[:n_votes], votes_yes.tolist(), vote_pac_idx.tolist(), pac_funded.tolist()
+        )
+    ]
 
     # Generate policies
-    policies = []
-    for i in range(10):
-        policies.append({
+    n_policies = 10
+    has_beneficiary = rng.random(n_policies) < capture_rate
+    beneficiary_idx = rng.integers(0, len(donors), size=n_policies)
+    passed = rng.random(n_policies) < 0.7
+
+    policies = [
+        {
             "id": f"POL-{i:06d}",
             "name": f"Policy_{i}",
-            "beneficiaries": [random.choice(donors)] if random.random() < capture_rate else [],
-            "outcome": "passed" if random.random() < 0.7 else "failed"
-        })
+            "beneficiaries": [donors[beneficiary]] if benefits else [],
+            "outcome": "passed" if passes else "failed"
+        }
+        for i, (benefits, beneficiary, passes) in enumerate(zip(
+            has_beneficiary.tolist(), beneficiary_idx.tolist(), passed.tolist()
+        ))
+    ]
 
     return donations, challenges, votes, policies
@@ -11,11 +11,18 @@ Key data:
 - Records unsealed December 19, 2025
 """
 
+import functools
+import random
 from typing import Any
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 
 from .core import (
+    _canonical_json,
     emit_receipt,
+    emit_receipts_batch,
+    ReceiptBuffer,
     dual_hash,
     TENANT_ID,
     PAXTON_TRUST_DISBURSEMENT_USD,
@@ -32,22 +39,18 @@ def ingest_trust_disbursement(disbursement: dict) -> dict:
     Returns:
         Enriched disbursement with analysis flags
     """
-    # Check for self-dealing indicators
-    beneficiary = disbursement.get("beneficiary", "").lower()
-    trustor = disbursement.get("trustor", "").lower()
-    purpose = disbursement.get("purpose", "").lower()
-
-    flags = []
-    if beneficiary == trustor or trustor in beneficiary:
-        flags.append("potential_self_dealing")
-    if "legal" in purpose and beneficiary == trustor:
-        flags.append("legal_fee_to_trustor")
-    if disbursement.get("was_sealed", False):
-        flags.append("previously_sealed")
+    # Check for self-dealing indicators (memoized per distinct record shape)
+    beneficiary, flags_mask, flags = _trust_flags(
+        disbursement.get("beneficiary", ""),
+        disbursement.get("trustor", ""),
+        disbursement.get("purpose", ""),
+        bool(disbursement.get("was_sealed", False))
+    )
 
     enriched = {
         **disbursement,
-        "self_dealing_flags": flags,
+        "self_dealing_flags": list(flags),
+        "self_dealing_flags_mask": flags_mask,
         "flag_count": len(flags),
         "ingested": True
     }
@@ -59,12 +62,40 @@ def ingest_trust_disbursement(disbursement: dict) -> dict:
         "amount_usd": disbursement.get("amount_usd", 0),
         "beneficiary": beneficiary,
         "flag_count": len(flags),
-        "payload_hash": dual_hash(str(disbursement))
+        "payload_hash": dual_hash(_canonical_json(disbursement))
     })
 
     return enriched
 
 
+# Self-dealing ingest flags, as bits of an ingest flags mask
+TRUST_FLAG_POTENTIAL_SELF_DEALING = 1
+TRUST_FLAG_LEGAL_FEE_TO_TRUSTOR = 2
+TRUST_FLAG_PREVIOUSLY_SEALED = 4
+
+TRUST_FLAG_NAMES = (
+    (TRUST_FLAG_POTENTIAL_SELF_DEALING, "potential_self_dealing"),
+    (TRUST_FLAG_LEGAL_FEE_TO_TRUSTOR, "legal_fee_to_trustor"),
+    (TRUST_FLAG_PREVIOUSLY_SEALED, "previously_sealed"),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _trust_flags(beneficiary: str, trustor: str, purpose: str, was_sealed: bool) -> tuple:
+    """(lowercased beneficiary, flags mask, flag names) for one disbursement shape."""
+    beneficiary = beneficiary.lower()
+    trustor = trustor.lower()
+    purpose = purpose.lower()
+
+    mask = (
+        (TRUST_FLAG_POTENTIAL_SELF_DEALING if beneficiary == trustor or trustor in beneficiary else 0) |
+        (TRUST_FLAG_LEGAL_FEE_TO_TRUSTOR if "legal" in purpose and beneficiary == trustor else 0) |
+        (TRUST_FLAG_PREVIOUSLY_SEALED if was_sealed else 0)
+    )
+
+    return beneficiary, mask, tuple(name for bit, name in TRUST_FLAG_NAMES if mask & bit)
+
+
 def detect_self_dealing(
     disbursements: list,
     beneficiaries: list,
@@ -82,48 +113,135 @@ def detect_self_dealing(
         List of self-dealing detection dicts
     """
     self_dealing_cases = []
-    allowed_beneficiaries = set(b.lower() for b in beneficiaries)
-    allowed_purposes = set(p.lower() for p in purposes)
+    allowed_beneficiaries = _lower_set(tuple(beneficiaries))
+    allowed_purposes = _lower_set(tuple(purposes))
+
+    # Trust ledgers repeat a handful of trustor/beneficiary/purpose triples,
+    # so each distinct triple is lowercased and classified once
+    verdicts = {}
 
     for d in disbursements:
-        trustor = d.get("trustor", "").lower()
-        beneficiary = d.get("beneficiary", "").lower()
-        purpose = d.get("purpose", "").lower()
-
-        is_self_dealing = False
-        reasons = []
-
-        # Check if beneficiary is trustor or close relation
-        if trustor == beneficiary:
-            is_self_dealing = True
-            reasons.append("beneficiary_is_trustor")
-
-        # Check if beneficiary is not in allowed list
-        if beneficiary not in allowed_beneficiaries and "trustor" not in beneficiary:
-            is_self_dealing = True
-            reasons.append("beneficiary_not_allowed")
-
-        # Check purpose
-        if purpose not in allowed_purposes:
-            # Not automatically self-dealing, but flagged
-            reasons.append("purpose_not_standard")
-
-        # Legal fees to trustor is suspicious
-        if "legal" in purpose and trustor in beneficiary:
-            is_self_dealing = True
-            reasons.append("legal_fee_self_payment")
-
-        if is_self_dealing or reasons:
-            self_dealing_cases.append({
-                **d,
-                "is_self_dealing": is_self_dealing,
-                "reasons": reasons,
-                "severity": "high" if is_self_dealing else "medium"
-            })
+        case = _self_dealing_case(d, verdicts, allowed_beneficiaries, allowed_purposes)
+        if case is not None:
+            self_dealing_cases.append(case)
 
     return self_dealing_cases
 
 
+@functools.lru_cache(maxsize=16)
+def _lower_set(values: tuple) -> frozenset:
+    """Lowercased allow-list, built once per distinct list of values."""
+    return frozenset(v.lower() for v in values)
+
+
+def _self_dealing_case(
+    disbursement: dict,
+    verdicts: dict,
+    allowed_beneficiaries: frozenset,
+    allowed_purposes: frozenset
+) -> dict:
+    """Self-dealing detection dict for one disbursement, or None if it is clean."""
+    key = (
+        disbursement.get("trustor", ""),
+        disbursement.get("beneficiary", ""),
+        disbursement.get("purpose", "")
+    )
+    verdict = verdicts.get(key)
+    if verdict is None:
+        verdict = verdicts[key] = _self_dealing_verdict(
+            *key, allowed_beneficiaries, allowed_purposes
+        )
+    is_self_dealing, reasons = verdict
+
+    # Every self-dealing verdict carries at least one reason
+    if not reasons:
+        return None
+    return {
+        **disbursement,
+        "is_self_dealing": is_self_dealing,
+        "reasons": list(reasons),
+        "severity": "high" if is_self_dealing else "medium"
+    }
+
+
+def _self_dealing_verdict(
+    trustor: str,
+    beneficiary: str,
+    purpose: str,
+    allowed_beneficiaries: frozenset,
+    allowed_purposes: frozenset
+) -> tuple:
+    """(is_self_dealing, reasons) for one trustor/beneficiary/purpose triple."""
+    trustor = trustor.lower()
+    beneficiary = beneficiary.lower()
+    purpose = purpose.lower()
+
+    is_self_dealing = False
+    reasons = []
+
+    # Check if beneficiary is trustor or close relation
+    if trustor == beneficiary:
+        is_self_dealing = True
+        reasons.append("beneficiary_is_trustor")
+
+    # Check if beneficiary is not in allowed list
+    if beneficiary not in allowed_beneficiaries and "trustor" not in beneficiary:
+        is_self_dealing = True
+        reasons.append("beneficiary_not_allowed")
+
+    # Check purpose
+    if purpose not in allowed_purposes:
+        # Not automatically self-dealing, but flagged
+        reasons.append("purpose_not_standard")
+
+    # Legal fees to trustor is suspicious
+    if "legal" in purpose and trustor in beneficiary:
+        is_self_dealing = True
+        reasons.append("legal_fee_self_payment")
+
+    return is_self_dealing, tuple(reasons)
+
+
+# Microseconds per day, and the naive epoch parsed dates are measured from
+_DAY_US = 86_400_000_000
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _iso_microseconds(value: Any) -> Any:
+    """Microseconds since the epoch for an ISO date string, or None if unparseable."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return (parsed - _EPOCH) // timedelta(microseconds=1)
+
+
+def _parse_dates(records: list) -> tuple:
+    """
+    (positions, int64 microseconds) for records with a parseable "date".
+
+    Each distinct date string is parsed once; unparseable records are
+    skipped, as the per-pair loop used to skip them.
+    """
+    parsed = {}
+    positions = []
+    stamps = []
+    for i, record in enumerate(records):
+        value = record.get("date", "2020-01-01")
+        try:
+            stamp = parsed[value]
+        except KeyError:
+            stamp = parsed[value] = _iso_microseconds(value)
+        except TypeError:
+            stamp = _iso_microseconds(value)
+        if stamp is not None:
+            positions.append(i)
+            stamps.append(stamp)
+    return positions, np.array(stamps, dtype=np.int64)
+
+
 def analyze_trust_timing(disbursements: list, legal_events: list) -> dict:
     """
     Analyze timing of disbursements relative to legal events.
@@ -137,37 +255,46 @@ def analyze_trust_timing(disbursements: list, legal_events: list) -> dict:
     """
     correlations = []
 
-    for d in disbursements:
-        try:
-            d_date = datetime.fromisoformat(d.get("date", "2020-01-01"))
-        except (ValueError, TypeError):
-            continue
-
-        for event in legal_events:
-            try:
-                e_date = datetime.fromisoformat(event.get("date", "2020-01-01"))
-            except (ValueError, TypeError):
-                continue
-
-            days_diff = (d_date - e_date).days
-
-            # Disbursement within 30 days before legal event
-            if -30 <= days_diff <= 0:
-                correlations.append({
-                    "disbursement": d,
-                    "event": event,
-                    "days_before_event": abs(days_diff),
-                    "correlation_type": "pre_event_disbursement"
-                })
-
-            # Disbursement within 7 days after legal event
-            elif 0 < days_diff <= 7:
-                correlations.append({
-                    "disbursement": d,
-                    "event": event,
-                    "days_after_event": days_diff,
-                    "correlation_type": "post_event_disbursement"
-                })
+    # Parse every date once
+    d_positions, d_stamps = _parse_dates(disbursements)
+    e_positions, e_stamps = _parse_dates(legal_events)
+
+    # Disbursement within 30 days before or 7 days after a legal event, i.e.
+    # -30 <= floor((d - e) / day) <= 7, i.e. d - 8 days < e <= d + 30 days;
+    # binary search that window in the sorted event dates
+    order = np.argsort(e_stamps, kind="stable")
+    e_sorted = e_stamps[order]
+    lo = np.searchsorted(e_sorted, d_stamps - 8 * _DAY_US, side="right")
+    hi = np.searchsorted(e_sorted, d_stamps + 30 * _DAY_US, side="right")
+
+    # Expand the windows into (disbursement, event) pairs, restoring
+    # disbursement-major, event-minor order
+    counts = hi - lo
+    d_idx = np.repeat(np.arange(len(d_stamps)), counts)
+    e_idx = order[np.arange(len(d_idx)) - np.repeat(np.cumsum(counts) - counts - lo, counts)]
+    pairs = np.lexsort((e_idx, d_idx))
+    d_idx = d_idx[pairs]
+    e_idx = e_idx[pairs]
+    days_diff = (d_stamps[d_idx] - e_stamps[e_idx]) // _DAY_US
+
+    for i, j, diff in zip(d_idx.tolist(), e_idx.tolist(), days_diff.tolist()):
+        d = disbursements[d_positions[i]]
+        event = legal_events[e_positions[j]]
+
+        if diff <= 0:
+            correlations.append({
+                "disbursement": d,
+                "event": event,
+                "days_before_event": abs(diff),
+                "correlation_type": "pre_event_disbursement"
+            })
+        else:
+            correlations.append({
+                "disbursement": d,
+                "event": event,
+                "days_after_event": diff,
+                "correlation_type": "post_event_disbursement"
+            })
 
     return {
         "correlations": correlations,
@@ -186,7 +313,12 @@ def emit_trust_receipt(findings: dict) -> dict:
     Returns:
         Trust disbursement receipt
     """
-    return emit_receipt("trust_disbursement", {
+    return emit_receipt("trust_disbursement", _trust_receipt_payload(findings))
+
+
+def _trust_receipt_payload(findings: dict) -> dict:
+    """trust_disbursement_receipt payload for a findings dict."""
+    return {
         "tenant_id": TENANT_ID,
         "trust_name": findings.get("trust_name", "unknown"),
         "trustor": findings.get("trustor", "unknown"),
@@ -196,7 +328,7 @@ def emit_trust_receipt(findings: dict) -> dict:
         "is_self_dealing": findings.get("is_self_dealing", False),
         "self_dealing_probability": findings.get("self_dealing_probability", 0),
         "was_sealed": findings.get("was_sealed", False)
-    })
+    }
 
 
 def analyze_blind_trust(
@@ -224,23 +356,22 @@ def analyze_blind_trust(
     results = {
         "trust_name": trust_name,
         "total_disbursements": len(disbursements),
-        "total_amount_usd": sum(d.get("amount_usd", 0) for d in disbursements),
+        "total_amount_usd": 0,
         "self_dealing_cases": [],
         "timing_analysis": None,
         "receipts": []
     }
 
-    # Ingest all disbursements
-    for d in disbursements:
-        ingest_trust_disbursement(d)
-
-    # Detect self-dealing
-    self_dealing = detect_self_dealing(disbursements, allowed_beneficiaries, allowed_purposes)
-    results["self_dealing_cases"] = self_dealing
-    results["self_dealing_count"] = len([s for s in self_dealing if s.get("is_self_dealing")])
-    results["self_dealing_amount_usd"] = sum(
-        s.get("amount_usd", 0) for s in self_dealing if s.get("is_self_dealing")
+    # Ingest and detect self-dealing in one pass over the disbursements
+    total_amount, self_dealing, self_dealing_count, self_dealing_amount = _analyze_pass(
+        disbursements,
+        _lower_set(tuple(allowed_beneficiaries)),
+        _lower_set(tuple(allowed_purposes))
     )
+    results["total_amount_usd"] = total_amount
+    results["self_dealing_cases"] = self_dealing
+    results["self_dealing_count"] = self_dealing_count
+    results["self_dealing_amount_usd"] = self_dealing_amount
 
     # Timing analysis
     if legal_events:
@@ -257,24 +388,60 @@ def analyze_blind_trust(
 
     results["self_dealing_probability"] = min(1.0, prob)
 
-    # Emit receipts for self-dealing cases
-    for case in self_dealing:
-        if case.get("is_self_dealing"):
-            receipt = emit_trust_receipt({
-                "trust_name": trust_name,
-                "trustor": case.get("trustor"),
-                "beneficiary": case.get("beneficiary"),
-                "amount_usd": case.get("amount_usd", 0),
-                "purpose": case.get("purpose"),
-                "is_self_dealing": True,
-                "self_dealing_probability": results["self_dealing_probability"],
-                "was_sealed": case.get("was_sealed", False)
-            })
-            results["receipts"].append(receipt)
+    # Emit receipts for self-dealing cases with a single ledger write
+    results["receipts"] = emit_receipts_batch([
+        ("trust_disbursement", _trust_receipt_payload({
+            "trust_name": trust_name,
+            "trustor": case.get("trustor"),
+            "beneficiary": case.get("beneficiary"),
+            "amount_usd": case.get("amount_usd", 0),
+            "purpose": case.get("purpose"),
+            "is_self_dealing": True,
+            "self_dealing_probability": results["self_dealing_probability"],
+            "was_sealed": case.get("was_sealed", False)
+        }))
+        for case in self_dealing
+        if case.get("is_self_dealing")
+    ])
 
     return results
 
 
+def _analyze_pass(
+    disbursements: list,
+    allowed_beneficiaries: frozenset,
+    allowed_purposes: frozenset
+) -> tuple:
+    """
+    Ingest every disbursement and collect its self-dealing case in one pass.
+
+    Returns:
+        Tuple of (total_amount_usd, self_dealing_cases, self_dealing_count,
+        self_dealing_amount_usd)
+    """
+    total_amount = 0
+    self_dealing_cases = []
+    self_dealing_count = 0
+    self_dealing_amount = 0
+    verdicts = {}
+
+    # Ingest receipts are written to the ledger in batches
+    with ReceiptBuffer():
+        for d in disbursements:
+            amount = d.get("amount_usd", 0)
+            total_amount += amount
+            ingest_trust_disbursement(d)
+
+            case = _self_dealing_case(d, verdicts, allowed_beneficiaries, allowed_purposes)
+            if case is not None:
+                self_dealing_cases.append(case)
+                if case["is_self_dealing"]:
+                    self_dealing_count += 1
+                    self_dealing_amount += amount
+
+    return total_amount, self_dealing_cases, self_dealing_count, self_dealing_amount
+
+
 def generate_synthetic_trust_data(n_disbursements: int, self_dealing_rate: float = 0.2) -> list:
     """
     Generate synthetic trust disbursement data.
@@ -282,38 +449,48 @@ def generate_synthetic_trust_data(n_disbursements: int, self_dealing_rate: float
     Returns:
         List of disbursement dicts
     """
-    import random
-
-    disbursements = []
-
-    for i in range(n_disbursements):
-        is_self_dealing = random.random() < self_dealing_rate
-
-        if is_self_dealing:
-            disbursement = {
-                "id": f"TRUST-{i:06d}",
-                "trust_name": "Paxton Blind Trust",
-                "trustor": "Ken Paxton",
-                "beneficiary": random.choice(["Ken Paxton", "Angela Paxton"]),
-                "amount_usd": random.uniform(5000, 50000),
-                "purpose": random.choice(["legal fees", "personal expenses", "consulting"]),
-                "date": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-                "was_sealed": random.random() < 0.7,
-                "is_synthetic_self_dealing": True
-            }
-        else:
-            disbursement = {
-                "id": f"TRUST-{i:06d}",
-                "trust_name": "Paxton Blind Trust",
-                "trustor": "Ken Paxton",
-                "beneficiary": random.choice(["Charity Foundation", "Investment Fund", "Trust Management Co"]),
-                "amount_usd": random.uniform(1000, 20000),
-                "purpose": random.choice(["charitable donation", "investment", "administrative"]),
-                "date": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-                "was_sealed": random.random() < 0.3,
-                "is_synthetic_self_dealing": False
-            }
-
-        disbursements.append(disbursement)
-
-    return disbursements
+    # Draw every column in one call; seeding from the global random stream
+    # keeps random.seed() reproducibility for the scenarios
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    is_self_dealing = rng.random(n_disbursements) < self_dealing_rate
+
+    # Self-dealing disbursements go to the trustors for personal purposes
+    self_beneficiaries = ("Ken Paxton", "Angela Paxton")
+    self_purposes = ("legal fees", "personal expenses", "consulting")
+    fair_beneficiaries = ("Charity Foundation", "Investment Fund", "Trust Management Co")
+    fair_purposes = ("charitable donation", "investment", "administrative")
+    beneficiary_idx = np.where(
+        is_self_dealing,
+        rng.integers(0, len(self_beneficiaries), size=n_disbursements),
+        rng.integers(0, len(fair_beneficiaries), size=n_disbursements)
+    )
+    purpose_idx = np.where(
+        is_self_dealing,
+        rng.integers(0, len(self_purposes), size=n_disbursements),
+        rng.integers(0, len(fair_purposes), size=n_disbursements)
+    )
+    amounts = rng.uniform(
+        np.where(is_self_dealing, 5000, 1000), np.where(is_self_dealing, 50000, 20000)
+    )
+    months = rng.integers(1, 13, size=n_disbursements)
+    days = rng.integers(1, 29, size=n_disbursements)
+    was_sealed = rng.random(n_disbursements) < np.where(is_self_dealing, 0.7, 0.3)
+
+    return [
+        {
+            "id": f"TRUST-{i:06d}",
+            "trust_name": "Paxton Blind Trust",
+            "trustor": "Ken Paxton",
+            "beneficiary": (self_beneficiaries if sd else fair_beneficiaries)[b],
+            "amount_usd": amount,
+            "purpose": (self_purposes if sd else fair_purposes)[p],
+            "date": f"2024-{month:02d}-{day:02d}",
+            "was_sealed": sealed,
+            "is_synthetic_self_dealing": sd
+        }
+        for i, (sd, b, amount, p, month, day, sealed) in enumerate(zip(
+            is_self_dealing.tolist(), beneficiary_idx.tolist(), amounts.tolist(),
+            purpose_idx.tolist(), months.tolist(), days.tolist(), was_sealed.tolist()
+        ))
+    ]
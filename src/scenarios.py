@@ -15,8 +15,11 @@ from dataclasses import dataclass
 from typing import Any
 import random
 
+import numpy as np
+
 from .core import (
     emit_receipt,
+    emit_receipts_batch,
     TENANT_ID,
     BASELINE_DETECTION_THRESHOLD,
     STRESS_ALPHA_THRESHOLD,
@@ -29,11 +32,14 @@ from .entropy import resilience_alpha
 from .ols_contractor_proof import (
     generate_synthetic_ols_contracts,
     score_contract_fraud,
+    score_contract_fraud_batch,
     analyze_ols_contractors,
+    detect_fund_diversion,
 )
 from .pac_influence_proof import (
     generate_synthetic_pac_data,
     score_influence_capture,
+    score_influence_capture_each,
     analyze_pac_influence,
 )
 from .predatory_lending_proof import (
@@ -48,6 +54,8 @@ from .genesis import run_genesis_cycle, detect_emerging_scandal
 @dataclass
 class ScenarioResult:
     """Result of a scenario run."""
+    __slots__ = ("name", "passed", "metrics", "receipts", "violations")
+
     name: str
     passed: bool
     metrics: dict
@@ -79,25 +87,16 @@ def scenario_baseline(n_contracts: int = 1000, fraud_rate: float = 0.2, seed: in
     # Build donor network (empty for baseline)
     donor_network = {}
 
-    # Run detection
-    true_positives = 0
-    false_negatives = 0
+    # Run detection; only actually fraudulent contracts count toward the
+    # detection rate, so only they are scored, as one batch
     receipts = []
-
-    for contract in contracts:
-        is_actually_fraud = contract.get("is_synthetic_fraud", False)
-        fraud_score = score_contract_fraud(contract, donor_network)
-
-        detected_as_fraud = fraud_score >= 0.7
-
-        if is_actually_fraud:
-            if detected_as_fraud:
-                true_positives += 1
-            else:
-                false_negatives += 1
+    fraud_contracts = [c for c in contracts if c.get("is_synthetic_fraud")]
+    detected = score_contract_fraud_batch(fraud_contracts, donor_network) >= 0.7
+    true_positives = int(np.count_nonzero(detected))
+    false_negatives = len(fraud_contracts) - true_positives
 
     # Calculate detection rate
-    total_fraud = sum(1 for c in contracts if c.get("is_synthetic_fraud"))
+    total_fraud = len(fraud_contracts)
     detection_rate = true_positives / total_fraud if total_fraud > 0 else 1.0
 
     passed = detection_rate >= BASELINE_DETECTION_THRESHOLD
@@ -159,23 +158,22 @@ def scenario_stress(
 
     detection_rates = []
 
+    # A capture's score does not depend on pressure, so each capture is
+    # scored once up front rather than once per pressure level
+    captures = [d for d in donations if d.get("is_synthetic_capture")]
+    detectable = (score_influence_capture_each(captures, policies) >= 0.5).tolist()
+    total_captures = len(detectable)
+
     for pressure in pressure_levels:
         # Simulate pressure effect: higher pressure = some detections suppressed
         suppression_rate = pressure * 0.3  # Max 30% suppression at full pressure
 
-        # Run detection with pressure
-        true_positives = 0
-        total_captures = 0
-
-        for d in donations:
-            if d.get("is_synthetic_capture"):
-                total_captures += 1
-                # Detection might be suppressed under pressure
-                if random.random() > suppression_rate:
-                    # Still detect if score high enough
-                    capture_score = score_influence_capture([d], policies)
-                    if capture_score >= 0.5:
-                        true_positives += 1
+        # Run detection with pressure; detection might be suppressed, and is
+        # still only counted if the score is high enough (one draw per capture)
+        true_positives = sum(
+            1 for is_detectable in detectable
+            if random.random() > suppression_rate and is_detectable
+        )
 
         rate = true_positives / total_captures if total_captures > 0 else 1.0
         detection_rates.append(rate)
@@ -208,6 +206,10 @@ def scenario_stress(
     return result
 
 
+# Wound timestamps for scenario_genesis, one per day of a 28-day cycle
+_GENESIS_TS = tuple(f"2024-01-{day:02d}T12:00:00Z" for day in range(1, 29))
+
+
 def scenario_genesis(n_cycles: int = 500, wound_rate: float = 0.1, seed: int = 42) -> ScenarioResult:
     """
     SCENARIO 3: GENESIS (Self-Spawn Watchers)
@@ -226,28 +228,42 @@ def scenario_genesis(n_cycles: int = 500, wound_rate: float = 0.1, seed: int = 4
     random.seed(seed)
 
     receipts = []
+    wounds = []  # Wound receipts, kept alongside receipts for spawning
     watchers = []
 
     # Simulate cycles with wounds
     wound_types = ["unauthorized_invoice", "audit_delay", "high_risk_contract", "suspicious_donation"]
 
-    for cycle in range(n_cycles):
+    severities = ["low", "medium", "high"]
+
+    # Draw every cycle's wound in one call per field; seeding from the
+    # global random stream keeps random.seed() reproducibility
+    rng = np.random.default_rng(random.getrandbits(64))
+    wounded = rng.random(n_cycles) < wound_rate
+    wound_type_idx = rng.integers(0, len(wound_types), size=n_cycles)
+    severity_idx = rng.integers(0, len(severities), size=n_cycles)
+    fraud_probabilities = rng.uniform(0.5, 1.0, size=n_cycles)
+
+    for cycle, (is_wounded, t, sev, fraud_probability) in enumerate(zip(
+        wounded.tolist(), wound_type_idx.tolist(), severity_idx.tolist(),
+        fraud_probabilities.tolist()
+    )):
         # Generate wound with some probability
-        if random.random() < wound_rate:
-            wound_type = random.choice(wound_types)
+        if is_wounded:
+            ts = _GENESIS_TS[cycle % 28]
             wound = {
                 "receipt_type": "wound",
-                "wound_type": wound_type,
-                "ts": f"2024-01-{(cycle % 28) + 1:02d}T12:00:00Z",
-                "created_at": f"2024-01-{(cycle % 28) + 1:02d}T12:00:00Z",
-                "severity": random.choice(["low", "medium", "high"]),
-                "fraud_probability": random.uniform(0.5, 1.0)
+                "wound_type": wound_types[t],
+                "ts": ts,
+                "created_at": ts,
+                "severity": severities[sev],
+                "fraud_probability": fraud_probability
             }
             receipts.append(wound)
+            wounds.append(wound)
 
         # Try to spawn watchers periodically
         if cycle % 50 == 0 and cycle > 0:
-            wounds = [r for r in receipts if r.get("receipt_type") == "wound"]
             watcher = spawn_watcher(wounds, threshold=5)
             if watcher:
                 watchers.append(watcher)
@@ -322,12 +338,9 @@ def scenario_colony_ridge(
 
     # Calculate detection rate
     # Count actual churned properties
-    actual_churned = set()
-    for t in transactions:
-        if t.get("is_synthetic_churn"):
-            actual_churned.add(t.get("property_id"))
+    actual_churned = {t.get("property_id") for t in transactions if t.get("is_synthetic_churn")}
 
-    detected_churned = set(p.get("property_id") for p in results.get("churning_properties", []))
+    detected_churned = {p.get("property_id") for p in results.get("churning_properties", [])}
 
     if actual_churned:
         detection_rate = len(detected_churned & actual_churned) / len(actual_churned)
@@ -389,14 +402,23 @@ def scenario_fund_diversion(
     departments = ["TDCJ", "DPS", "DSHS", "TWC", "TxDOT"]
     programs = ["Operation Lone Star", "Border Security", "Emergency Response"]
 
-    for i in range(n_diversions):
-        source = random.choice(departments)
-        dest = random.choice(programs)
-        amount = random.uniform(10_000_000, 100_000_000)
+    # Draw every diversion and every budget in one call each; seeding from
+    # the global random stream keeps random.seed() reproducibility
+    rng = np.random.default_rng(random.getrandbits(64))
+    source_idx = rng.integers(0, len(departments), size=n_diversions)
+    dest_idx = rng.integers(0, len(programs), size=n_diversions)
+    amounts = rng.uniform(10_000_000, 100_000_000, size=n_diversions)
+    source_originals = rng.uniform(500_000_000, 2_000_000_000, size=len(departments))
+    dest_originals = rng.uniform(100_000_000, 500_000_000, size=len(programs))
+    dest_actuals = rng.uniform(100_000_000, 500_000_000, size=len(programs))
+
+    for s, d, amount in zip(source_idx.tolist(), dest_idx.tolist(), amounts.tolist()):
+        source = departments[s]
+        dest = programs[d]
 
         # Set up source budget
         if source not in source_budgets:
-            original = random.uniform(500_000_000, 2_000_000_000)
+            original = float(source_originals[s])
             source_budgets[source] = {
                 "original_usd": original,
                 "actual_usd": original,
@@ -409,8 +431,8 @@ def scenario_fund_diversion(
         # Set up destination spending
         if dest not in dest_spending:
             dest_spending[dest] = {
-                "original_usd": random.uniform(100_000_000, 500_000_000),
-                "actual_usd": random.uniform(100_000_000, 500_000_000)
+                "original_usd": float(dest_originals[d]),
+                "actual_usd": float(dest_actuals[d])
             }
 
         dest_spending[dest]["actual_usd"] += amount
@@ -422,7 +444,6 @@ def scenario_fund_diversion(
         })
 
     # Run detection (with some noise)
-    from .ols_contractor_proof import detect_fund_diversion
     detected = detect_fund_diversion(source_budgets, dest_spending)
 
     # Calculate detection rate (allow for noise)
@@ -491,6 +512,7 @@ def scenario_godel(seed: int = 42) -> ScenarioResult:
     edge_cases = []
     graceful_failures = 0
     uncertainty_receipts = []
+    uncertainty_payloads = []  # Emitted together with the scenario receipt
 
     # Edge case 1: Zero-dollar contract
     try:
@@ -508,7 +530,7 @@ def scenario_godel(seed: int = 42) -> ScenarioResult:
         })
         graceful_failures += 1
 
-        emit_receipt("uncertainty", {
+        uncertainty_payloads.append({
             "tenant_id": TENANT_ID,
             "case": "zero_dollar_contract",
             "reason": "Zero-dollar contract flagged for review"
@@ -537,7 +559,7 @@ def scenario_godel(seed: int = 42) -> ScenarioResult:
         })
         graceful_failures += 1
 
-        emit_receipt("uncertainty", {
+        uncertainty_payloads.append({
             "tenant_id": TENANT_ID,
             "case": "negative_donation",
             "reason": "Negative donation rejected"
@@ -565,7 +587,7 @@ def scenario_godel(seed: int = 42) -> ScenarioResult:
         })
         graceful_failures += 1
 
-        emit_receipt("uncertainty", {
+        uncertainty_payloads.append({
             "tenant_id": TENANT_ID,
             "case": "self_referential_pac",
             "reason": "Self-referential PAC structure detected"
@@ -580,7 +602,6 @@ def scenario_godel(seed: int = 42) -> ScenarioResult:
 
     # Edge case 4: Empty input
     try:
-        from .predatory_lending_proof import calculate_foreclosure_rate
         rate = calculate_foreclosure_rate([])
         edge_cases.append({
             "case": "empty_input",
@@ -589,7 +610,7 @@ def scenario_godel(seed: int = 42) -> ScenarioResult:
         })
         graceful_failures += 1
 
-        emit_receipt("uncertainty", {
+        uncertainty_payloads.append({
             "tenant_id": TENANT_ID,
             "case": "empty_input",
             "reason": "Empty input handled gracefully"
@@ -618,12 +639,16 @@ def scenario_godel(seed: int = 42) -> ScenarioResult:
         violations=[] if passed else [f"Only {graceful_failures}/4 edge cases handled gracefully"]
     )
 
-    emit_receipt("godel_scenario", {
-        "tenant_id": TENANT_ID,
-        "passed": passed,
-        "graceful_failures": graceful_failures,
-        "uncertainty_receipts": len(uncertainty_receipts)
-    })
+    # Uncertainty receipts and the scenario receipt go out in one ledger write
+    emit_receipts_batch(
+        [("uncertainty", payload) for payload in uncertainty_payloads] +
+        [("godel_scenario", {
+            "tenant_id": TENANT_ID,
+            "passed": passed,
+            "graceful_failures": graceful_failures,
+            "uncertainty_receipts": len(uncertainty_receipts)
+        })]
+    )
 
     return result
 
@@ -639,16 +664,19 @@ def run_scenario(name: str, **kwargs) -> ScenarioResult:
     Returns:
         ScenarioResult
     """
-    scenarios = {
-        "baseline": scenario_baseline,
-        "stress": scenario_stress,
-        "genesis": scenario_genesis,
-        "colony_ridge": scenario_colony_ridge,
-        "fund_diversion": scenario_fund_diversion,
-        "godel": scenario_godel
-    }
-
-    if name not in scenarios:
-        raise ValueError(f"Unknown scenario: {name}. Available: {list(scenarios.keys())}")
-
-    return scenarios[name](**kwargs)
+    scenario = _SCENARIOS.get(name)
+    if scenario is None:
+        raise ValueError(f"Unknown scenario: {name}. Available: {list(_SCENARIOS)}")
+
+    return scenario(**kwargs)
+
+
+# Scenario dispatch table for run_scenario, built once at import
+_SCENARIOS = {
+    "baseline": scenario_baseline,
+    "stress": scenario_stress,
+    "genesis": scenario_genesis,
+    "colony_ridge": scenario_colony_ridge,
+    "fund_diversion": scenario_fund_diversion,
+    "godel": scenario_godel
+}
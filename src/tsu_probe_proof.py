@@ -15,6 +15,7 @@ from typing import Any
 from datetime import datetime, timedelta
 
 from .core import (
+    _canonical_json,
     emit_receipt,
     dual_hash,
     TENANT_ID,
@@ -58,7 +59,7 @@ def ingest_invoice(invoice: dict) -> dict:
         "vendor": vendor,
         "amount_usd": invoice.get("amount_usd", 0),
         "flag_count": len(flags),
-        "payload_hash": dual_hash(str(invoice))
+        "payload_hash": dual_hash(_canonical_json(invoice))
     })
 
     return enriched
@@ -0,0 +1,39 @@
+"""Tests for the command-line entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import cli
+import src.core as core
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+class TestHelp:
+    """Tests for --help rendering."""
+
+    def test_help_does_not_import_core(self):
+        """Test that rendering --help leaves src.core out of sys.modules."""
+        code = (
+            "import sys\n"
+            "sys.argv = ['cli.py', '--help']\n"
+            "import cli\n"
+            "try:\n"
+            "    cli.main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('src.core' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+
+        assert "--sim SCENARIO" in result.stdout
+        assert result.stdout.splitlines()[-1] == "False"
+
+    def test_help_values_match_core(self):
+        """Test that the help-text copies of core values stay in sync."""
+        assert cli.SCENARIO_CHOICES == core.SCENARIO_NAMES
+        assert cli.DEFAULT_MONTE_CARLO_RUNS == core.DEFAULT_MONTE_CARLO_RUNS
+        assert cli.DEFAULT_SEED == core.DEFAULT_SEED
@@ -2,10 +2,14 @@
 
 import pytest
 import json
+import numpy as np
 from src.core import (
+    _canonical_json,
     dual_hash,
     emit_receipt,
+    emit_receipts_batch,
     merkle,
+    ReceiptBuffer,
     StopRuleException,
     TENANT_ID,
     SCENARIO_NAMES,
@@ -44,6 +48,31 @@ class TestDualHash:
         result2 = dual_hash("test2")
         assert result1 != result2
 
+    def test_dual_hash_buffer_types(self):
+        """Test that str, bytes, bytearray and memoryview hash identically."""
+        expected = dual_hash("test")
+        assert dual_hash(b"test") == expected
+        assert dual_hash(bytearray(b"test")) == expected
+        assert dual_hash(memoryview(b"test")) == expected
+
+
+class TestCanonicalJson:
+    """Tests for canonical payload serialization."""
+
+    def test_canonical_json_pinned_bytes(self):
+        """Test that non-ASCII strings and large floats serialize to fixed bytes."""
+        result = _canonical_json({"x": 1e16, "name": "José"})
+        assert result == b'{"name":"Jos\xc3\xa9","x":1e+16}'
+        assert dual_hash(result) == dual_hash('{"name":"José","x":1e+16}')
+
+    def test_canonical_json_numpy_values(self):
+        """Test that NumPy scalars and arrays serialize as plain JSON numbers."""
+        result = _canonical_json({"n": np.int64(3), "f": np.float64(0.5), "a": np.arange(2)})
+        assert result == b'{"a":[0,1],"f":0.5,"n":3}'
+
+        with pytest.raises(TypeError):
+            _canonical_json({"s": {1, 2}})
+
 
 class TestEmitReceipt:
     """Tests for emit_receipt function."""
@@ -61,6 +90,15 @@ class TestEmitReceipt:
         captured = capsys.readouterr()
         assert "test" in captured.out
 
+    def test_emit_receipt_line_matches_receipt(self, capsys):
+        """Test that the emitted ledger line parses back to the returned receipt."""
+        receipt = emit_receipt("test", {"b": 2, "a": "value"}, output=True)
+        shadowed = emit_receipt("test", {"receipt_type": "inner"}, output=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert json.loads(lines[0]) == receipt
+        assert json.loads(lines[1]) == shadowed
+
     def test_emit_receipt_no_output(self, capsys):
         """Test receipt emission without stdout."""
         receipt = emit_receipt("test", {"data": "value"}, output=False)
@@ -71,11 +109,58 @@ class TestEmitReceipt:
         captured = capsys.readouterr()
         assert captured.out == ""
 
+    def test_emit_receipt_timestamp_tracks_second(self, monkeypatch):
+        """Test that the cached second prefix is replaced whenever the second changes."""
+        stamps = iter([
+            1_700_000_000_250_000_000,
+            1_700_000_001_000_001_000,
+            1_700_000_000_999_999_000,
+        ])
+        monkeypatch.setattr("src.core.time.time_ns", lambda: next(stamps))
+
+        assert [emit_receipt("test", {}, output=False)["ts"] for _ in range(3)] == [
+            "2023-11-14T22:13:20.250000Z",
+            "2023-11-14T22:13:21.000001Z",
+            "2023-11-14T22:13:20.999999Z",
+        ]
+
     def test_emit_receipt_custom_tenant(self):
         """Test receipt with custom tenant_id."""
         receipt = emit_receipt("test", {"tenant_id": "custom"}, output=False)
         assert receipt["tenant_id"] == "custom"
 
+    def test_receipt_buffer_batches_output(self, capsys):
+        """Test that buffered receipts are written in batches and on exit."""
+        with ReceiptBuffer(n=2):
+            emit_receipt("test", {"i": 0})
+            assert capsys.readouterr().out == ""
+            emit_receipt("test", {"i": 1})
+            assert len(capsys.readouterr().out.splitlines()) == 2
+            emit_receipt("test", {"i": 2})
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["i"] for line in lines] == [2]
+
+    def test_receipt_buffer_nested_keeps_order(self, capsys):
+        """Test that a nested buffer defers to the outer one."""
+        with ReceiptBuffer():
+            emit_receipt("test", {"i": 0})
+            with ReceiptBuffer():
+                emit_receipt("test", {"i": 1})
+            assert capsys.readouterr().out == ""
+            emit_receipt("test", {"i": 2})
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["i"] for line in lines] == [0, 1, 2]
+
+    def test_emit_receipts_batch(self, capsys):
+        """Test that batched receipts come back in order and match the ledger."""
+        receipts = emit_receipts_batch([("test", {"i": 0}), ("other", {"i": 1})])
+
+        assert [r["receipt_type"] for r in receipts] == ["test", "other"]
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == receipts
+
 
 class TestMerkle:
     """Tests for merkle function."""
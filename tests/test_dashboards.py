@@ -0,0 +1,33 @@
+"""Tests for dashboards module."""
+
+from src.dashboards import (
+    _render_static,
+    generate_all_dashboards,
+    generate_ols_dashboard,
+)
+
+
+class TestGenerateAllDashboards:
+    """Tests for batch dashboard generation."""
+
+    def test_static_renders_cached_across_batches(self, tmp_path):
+        """Test that a second batch reuses every static render and gets its own stamp."""
+        _render_static.cache_clear()
+
+        first = generate_all_dashboards(str(tmp_path / "first"))
+        assert _render_static.cache_info().misses == len(first)
+
+        second = generate_all_dashboards(str(tmp_path / "second"))
+        info = _render_static.cache_info()
+        assert info.hits == len(second)
+        assert info.misses == len(first)
+
+    def test_cached_render_matches_direct_render(self, tmp_path):
+        """Test that a spliced dashboard equals rendering with the same timestamp."""
+        generated = generate_all_dashboards(str(tmp_path))
+
+        with open(generated["ols_contractor_dashboard.html"], encoding="utf-8") as f:
+            html = f.read()
+        timestamp = html.split("Generated: ", 1)[1].split("<", 1)[0]
+
+        assert html == generate_ols_dashboard(timestamp=timestamp)
@@ -0,0 +1,42 @@
+"""Tests for entropy module."""
+
+import math
+
+import pytest
+
+from src.entropy import (
+    clear_entropy_caches,
+    contract_entropy,
+    entropy_cache_info,
+    mdl_score,
+    system_entropy,
+)
+
+
+class TestEntropyCaches:
+    """Tests for the entropy memo caches."""
+
+    def test_system_entropy_memo_keys_on_counts(self):
+        """Test that streams with the same type counts share one memo entry."""
+        clear_entropy_caches()
+
+        first = system_entropy([{"receipt_type": "a"}, {"receipt_type": "a"}, {"receipt_type": "b"}])
+        second = system_entropy([{"receipt_type": "a"}, {"receipt_type": "b"}, {"receipt_type": "a"}])
+
+        info = entropy_cache_info()["receipt_type_entropy"]
+        assert (info.hits, info.misses) == (1, 1)
+        assert first == second == pytest.approx(math.log2(3) - 2 / 3)
+
+    def test_clear_entropy_caches(self, sample_contract):
+        """Test that clearing empties every entropy memo."""
+        system_entropy([{"receipt_type": "a"}, {"receipt_type": "b"}])
+        contract_entropy(sample_contract)
+        mdl_score(b"x" * 64, 0)
+
+        info = entropy_cache_info()
+        assert set(info) == {"receipt_type_entropy", "contract_type_score", "compressed_size"}
+        assert all(stats.currsize > 0 for stats in info.values())
+
+        clear_entropy_caches()
+
+        assert all(stats.currsize == 0 for stats in entropy_cache_info().values())
@@ -1,15 +1,24 @@
 """Tests for OLS contractor proof module."""
 
 import pytest
+import json
+import numpy as np
 from src.ols_contractor_proof import (
+    HAS_NUMBA,
+    _contract_type_flags,
+    _score_arrays,
     ingest_contract,
     detect_emergency_loop,
     score_contract_fraud,
+    score_contract_fraud_batch,
     detect_fund_diversion,
     emit_ols_receipt,
     generate_synthetic_ols_contracts,
     analyze_ols_contractors,
 )
+if HAS_NUMBA:
+    from src.ols_contractor_proof import _score_kernel
+from src.entropy import entropy_fraud_score, entropy_fraud_score_batch
 
 
 class TestIngestContract:
@@ -22,6 +31,7 @@ class TestIngestContract:
         assert enriched["ingested"] is True
         assert "entropy_score" in enriched
         assert "fraud_probability" in enriched
+        assert enriched["_name_lc"] == "test contractor inc"
 
     def test_ingest_contract_entropy(self, sample_contract):
         """Test entropy calculation on ingestion."""
@@ -30,6 +40,13 @@ class TestIngestContract:
         # Emergency/no-bid should have high entropy
         assert enriched["entropy_score"] > 0.5
 
+    def test_entropy_fraud_score_batch_matches_scalar(self, sample_contract):
+        """Test that batch scoring matches per-contract scoring."""
+        contracts = [sample_contract, {}] + generate_synthetic_ols_contracts(20)
+        batch = entropy_fraud_score_batch(contracts)
+
+        assert list(batch) == [entropy_fraud_score(c) for c in contracts]
+
 
 class TestScoreContractFraud:
     """Tests for fraud scoring."""
@@ -62,6 +79,55 @@ class TestScoreContractFraud:
         score = score_contract_fraud(sample_contract, donor_network)
         assert score > 0.7  # Donor correlation should increase score
 
+    def test_score_batch_values(self, sample_contract):
+        """Test batch scores factor by factor."""
+        donor_network = {
+            "test contractor inc": {"total_usd": 50_000},
+            "big mover llc": {"total_usd": 200_000},
+        }
+        contracts = [
+            sample_contract,
+            {},
+            {
+                "name": "Big Mover LLC",
+                "amount_usd": 60_000_000,
+                "contract_type": "No-Bid",
+                "cost_per_unit_usd": 2000,
+                "market_rate_usd": 500
+            },
+            {**sample_contract, "name": "Big Mover LLC", "amount_usd": 60_000_000},
+        ]
+        batch = score_contract_fraud_batch(contracts, donor_network)
+
+        assert list(batch) == pytest.approx([0.85, 0.0, 0.9, 1.0])
+
+    def test_score_contract_fraud_batch_matches_scalar(self, sample_contract):
+        """Test that batch scoring matches per-contract scoring."""
+        donor_network = {"test contractor inc": {"total_usd": 50_000}}
+        contracts = [sample_contract, {}] + generate_synthetic_ols_contracts(20)
+        batch = score_contract_fraud_batch(contracts, donor_network)
+
+        assert list(batch) == [score_contract_fraud(c, donor_network) for c in contracts]
+
+    @pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")
+    def test_score_kernel_matches_arrays(self, sample_contract):
+        """Test that the compiled kernel matches the NumPy implementation."""
+        contracts = [sample_contract, {}] + generate_synthetic_ols_contracts(200)
+        n = len(contracts)
+        type_flags = np.array(
+            [_contract_type_flags(c.get("contract_type", "")) for c in contracts], dtype=bool
+        ).reshape(n, 3)
+        amount = np.array([c.get("amount_usd", 0) for c in contracts], dtype=np.float64)
+        cost_per_unit = np.array([c.get("cost_per_unit_usd", 0) for c in contracts], dtype=np.float64)
+        market_rate = np.array(
+            [c.get("market_rate_usd", c.get("cost_per_unit_usd", 0)) for c in contracts],
+            dtype=np.float64
+        )
+        donation_total = np.linspace(0, 300_000, n)
+        columns = (type_flags, cost_per_unit, market_rate, donation_total, amount)
+
+        np.testing.assert_array_equal(_score_kernel(*columns), _score_arrays(*columns))
+
 
 class TestDetectEmergencyLoop:
     """Tests for emergency loop detection."""
@@ -170,3 +236,20 @@ class TestEmitOlsReceipt:
 
         captured = capsys.readouterr()
         assert "ols_contractor" in captured.out
+
+
+class TestAnalyzeOlsContractors:
+    """Tests for the full OLS analysis."""
+
+    def test_analyze_emits_receipts_in_contract_order(self, capsys):
+        """Test that each contract's ingest and OLS receipts are emitted in contract order."""
+        contracts = generate_synthetic_ols_contracts(40)
+        donations = [{"donor": c["name"], "amount": 200_000} for c in contracts[:5]]
+
+        results = analyze_ols_contractors(contracts, donations)
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        per_contract = lines[:2 * len(contracts)]
+        assert [r["receipt_type"] for r in per_contract] == ["ingest", "ols_contractor"] * len(contracts)
+        assert [r["contractor_name"] for r in per_contract[1::2]] == [c["name"] for c in contracts]
+        assert results["receipts"] == per_contract[1::2]
@@ -6,6 +6,7 @@ from src.pac_influence_proof import (
     trace_donor_to_policy,
     detect_primary_purge,
     score_influence_capture,
+    score_influence_capture_each,
     emit_pac_receipt,
     generate_synthetic_pac_data,
 )
@@ -99,6 +100,25 @@ class TestDetectPrimaryPurge:
         purges = detect_primary_purge(challenges, outcomes, impeachment_votes)
         assert len(purges) == 0
 
+    def test_purge_outcome_lookup(self):
+        """Test that outcomes match incumbents case-insensitively, first record winning."""
+        challenges = [
+            {"incumbent": "Rep Who Impeached", "challenger": "New Guy", "pac_funding_usd": 300_000}
+        ]
+        outcomes = [
+            {"incumbent": "Someone Else", "winner": "New Guy"},
+            {"incumbent": "REP WHO IMPEACHED", "winner": "New Guy"},
+            {"incumbent": "rep who impeached", "winner": "Rep Who Impeached"},
+        ]
+        impeachment_votes = [
+            {"legislator": "Rep Who Impeached", "vote": "aye"}
+        ]
+
+        purges = detect_primary_purge(challenges, outcomes, impeachment_votes)
+
+        assert purges[0]["outcome"] is outcomes[1]
+        assert purges[0]["purge_successful"] is True
+
 
 class TestScoreInfluenceCapture:
     """Tests for influence capture scoring."""
@@ -130,6 +150,25 @@ class TestScoreInfluenceCapture:
         score = score_influence_capture(donations, policies)
         assert score < 0.5
 
+    def test_score_each_matches_single_donation_scores(self):
+        """Test that per-donation batch scores match scoring each donation alone."""
+        donations = [
+            {"donor": "Mega Donor", "amount": 20_000_000},
+            {"donor": "Mega Donor", "amount": 1000},
+            {"donor": "Small Donor", "amount": 5_000_000},
+            {"donor": "Small Donor", "amount": 1000},
+            {"amount": 1000},
+        ]
+        policies = [
+            {"beneficiaries": ["Mega Donor"], "outcome": "passed", "beneficiary": "Mega Donor"},
+            {"beneficiaries": ["Other Person"], "outcome": "failed"},
+        ]
+
+        scores = score_influence_capture_each(donations, policies)
+
+        assert scores.tolist() == [score_influence_capture([d], policies) for d in donations]
+        assert score_influence_capture_each(donations, []).tolist() == [0.0] * len(donations)
+
 
 class TestGenerateSyntheticData:
     """Tests for synthetic PAC data generation."""
@@ -21,6 +21,7 @@ class TestIngestLoan:
 
         assert enriched["ingested"] is True
         assert "predatory_flags" in enriched
+        assert enriched["status_code"] == 0  # "active"
 
     def test_ingest_loan_predatory_flags(self, sample_loan):
         """Test predatory flag detection."""
@@ -29,6 +30,7 @@ class TestIngestLoan:
         # High interest + low down payment + seller financed
         assert len(enriched["predatory_flags"]) >= 2
         assert "high_interest" in enriched["predatory_flags"]
+        assert bin(enriched["predatory_flags_mask"]).count("1") == enriched["flag_count"]
 
 
 class TestDetectChurning:
@@ -152,6 +154,21 @@ class TestAnalyzeLendingPortfolio:
         assert "portfolio_metrics" in results
         assert "churning_properties" in results
 
+    def test_analyze_portfolio_groups_interleaved_transactions(self):
+        """Test that interleaved transactions are grouped per property."""
+        transactions = [
+            {"property_id": "PROP-001", "date": "2021-01-15", "transaction_type": "sale"},
+            {"property_id": "PROP-002", "date": "2022-01-15", "transaction_type": "sale"},
+            {"property_id": "PROP-001", "date": "2022-06-15", "transaction_type": "sale"},
+            {"date": "2022-07-15", "transaction_type": "sale"},
+            {"property_id": "PROP-001", "date": "2023-03-15", "transaction_type": "sale"},
+        ]
+
+        results = analyze_lending_portfolio([], transactions)
+
+        assert [p["property_id"] for p in results["churning_properties"]] == ["PROP-001"]
+        assert results["churning_properties"][0] == detect_churning("PROP-001", transactions)
+
 
 class TestEmitLendingReceipt:
     """Tests for lending receipt emission."""